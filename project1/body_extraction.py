@@ -65,17 +65,23 @@ class MarkdownBodyExtractor:
     Extracts body content between markdown headings while preserving formatting.
     """
 
-    # Regex pattern to match markdown headings
+    # Regex pattern to match markdown headings across a whole document. As in
+    # id_extraction, matches start at the newline before the heading and the
+    # whitespace after the markers excludes newlines, so a match is one line.
     HEADING_PATTERN = re.compile(
-        r'^(#{1,6})\s+(.+?)$',  # Capture heading level and text
+        r'\n(#{1,6})[^\S\n]+(.+?)$',  # Capture heading level and text
         re.MULTILINE
     )
 
+    # Regex pattern to detect an ID at the start of heading text
+    HEADING_ID_PATTERN = re.compile(r'^(R:|C:|D:|I:|M:|UI:|T:|TP:)([A-Za-z0-9_-]+)', re.IGNORECASE)
+
     def __init__(self):
         """Initialize the body extractor."""
         self.current_text = ""
         self.current_lines = []
         self.heading_boundaries = []
+        self.line_byte_offsets = {}  # line number -> byte position, for heading and body start lines
 
     def extract_body_ranges(self, markdown_text: str) -> List[Tuple[HeadingBoundary, BodyRange]]:
         """
@@ -145,40 +151,51 @@ class MarkdownBodyExtractor:
 
     def _find_heading_boundaries(self) -> List[HeadingBoundary]:
         """Find all heading boundaries in the current text."""
+        text = self.current_text
         boundaries = []
+        line_byte_offsets = {}
+        line_num = 0
         byte_position = 0
-
-        for line_num, line in enumerate(self.current_lines):
-            # Check if line is a heading
-            heading_match = self.HEADING_PATTERN.match(line)
-
-            if heading_match:
-                heading_markers, heading_text = heading_match.groups()
-                heading_level = len(heading_markers)
-
-                # Try to extract ID from heading text (basic check)
-                element_id = self._extract_id_from_heading_text(heading_text.strip())
-
-                boundary = HeadingBoundary(
-                    line_number=line_num,
-                    byte_position=byte_position,
-                    heading_level=heading_level,
-                    heading_text=heading_text.strip(),
-                    element_id=element_id
-                )
-
-                boundaries.append(boundary)
-
-            # Update byte position (including newline character)
-            byte_position += len(line.encode('utf-8')) + 1
-
+        position = 0  # Character position of the previous heading line
+
+        # One regex sweep over the whole text instead of matching line by line.
+        # The leading newline lets the pattern match a heading on the first line,
+        # and shifts match positions so they index the heading line in text.
+        for heading_match in self.HEADING_PATTERN.finditer('\n' + text):
+            heading_start = heading_match.start()
+            skipped = text[position:heading_start]
+            line_num += skipped.count('\n')
+            byte_position += len(skipped) if skipped.isascii() else len(skipped.encode('utf-8'))
+            position = heading_start
+
+            heading_markers, heading_text = heading_match.groups()
+            heading_level = len(heading_markers)
+
+            # Try to extract ID from heading text (basic check)
+            element_id = self._extract_id_from_heading_text(heading_text.strip())
+
+            boundary = HeadingBoundary(
+                line_number=line_num,
+                byte_position=byte_position,
+                heading_level=heading_level,
+                heading_text=heading_text.strip(),
+                element_id=element_id
+            )
+
+            boundaries.append(boundary)
+
+            # Record where the heading and the body after it start (including newline)
+            heading_line = heading_match.group(0)[1:]
+            heading_bytes = len(heading_line) if heading_line.isascii() else len(heading_line.encode('utf-8'))
+            line_byte_offsets[line_num] = byte_position
+            line_byte_offsets[line_num + 1] = byte_position + heading_bytes + 1
+
+        self.line_byte_offsets = line_byte_offsets
         return boundaries
 
     def _extract_id_from_heading_text(self, heading_text: str) -> Optional[str]:
         """Extract ID from heading text if present."""
-        # Simple regex to detect ID at start of heading
-        id_pattern = re.compile(r'^(R:|C:|D:|I:|M:|UI:|T:|TP:)([A-Za-z0-9_-]+)', re.IGNORECASE)
-        match = id_pattern.match(heading_text)
+        match = self.HEADING_ID_PATTERN.match(heading_text)
 
         if match:
             return match.group(0)  # Return full ID
@@ -232,11 +249,10 @@ class MarkdownBodyExtractor:
             # Position at end of document
             return len(self.current_text.encode('utf-8'))
 
-        byte_position = 0
-        for i in range(line_number):
-            if i < len(self.current_lines):
-                # Add line length + newline character
-                byte_position += len(self.current_lines[i].encode('utf-8')) + 1
+        # Offsets of heading and body start lines are recorded by the heading scan
+        byte_position = self.line_byte_offsets.get(line_number)
+        if byte_position is None:
+            byte_position = sum(len(line.encode('utf-8')) + 1 for line in self.current_lines[:line_number])
 
         return byte_position
 
@@ -6,9 +6,16 @@ This module defines the DocElement class and related enums as specified in D:Doc
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Optional
+from typing import List, Optional, Set
 import json
 
+# Use orjson for faster serialization if available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class Kind(Enum):
     """Element kind classification for organizing design artifacts."""
@@ -38,13 +45,27 @@ class Status(Enum):
     COMPLETED = "completed"
 
 
-@dataclass
+# Value -> member tables for deserialization; a dict probe is far cheaper than
+# Enum(value), which from_dict would otherwise pay three times per element
+_KIND_BY_VALUE = {kind.value: kind for kind in Kind}
+_FILE_BY_VALUE = {file.value: file for file in File}
+_STATUS_BY_VALUE = {status.value: status for status in Status}
+
+
+def _enum_from_value(lookup: dict, enum_cls: type, value) -> Enum:
+    """Look up an enum member by value, raising ValueError for unknown values like Enum(value)."""
+    member = lookup.get(value)
+    return member if member is not None else enum_cls(value)
+
+
+@dataclass(slots=True)
 class DocElement:
     """
     Core document element representing an addressable artifact component.
 
     Each DocElement corresponds to a heading-delimited section in a markdown file
-    with a stable ID for referencing and cross-linking.
+    with a stable ID for referencing and cross-linking. Slotted, since a
+    workspace index holds one instance per heading.
     """
 
     # Core identification
@@ -65,15 +86,29 @@ class DocElement:
     # Task-specific status (only applicable for Task kind)
     status: Optional[Status] = None
 
+    # Membership mirrors of refs/backlinks for O(1) duplicate checks, each with
+    # the (list, length) it was built from. A mirror is rebuilt when the public
+    # list has been reassigned or resized directly instead of through add_*
+    _refs_set: Set[str] = field(init=False, repr=False, compare=False)
+    _refs_synced: tuple = field(init=False, repr=False, compare=False)
+    _backlinks_set: Set[str] = field(init=False, repr=False, compare=False)
+    _backlinks_synced: tuple = field(init=False, repr=False, compare=False)
+
     def __post_init__(self):
         """Validate element after initialization."""
         if not self.id:
             raise ValueError("DocElement id cannot be empty")
 
-        if self.kind == Kind.TASK and self.status is None:
-            # Default status for new tasks
-            self.status = Status.PENDING
-        elif self.kind != Kind.TASK and self.status is not None:
+        self._refs_set = set(self.refs)
+        self._refs_synced = (self.refs, len(self.refs))
+        self._backlinks_set = set(self.backlinks)
+        self._backlinks_synced = (self.backlinks, len(self.backlinks))
+
+        if self.kind is Kind.TASK:
+            if self.status is None:
+                # Default status for new tasks
+                self.status = Status.PENDING
+        elif self.status is not None:
             # Status only valid for Task kind
             raise ValueError(f"Status field only valid for Task kind, got {self.kind}")
 
@@ -100,9 +135,9 @@ class DocElement:
     def from_dict(cls, data: dict) -> 'DocElement':
         """Create DocElement from dictionary (deserialization)."""
         # Convert enum string values back to enum instances
-        kind = Kind(data['kind'])
-        file = File(data['file'])
-        status = Status(data['status']) if data.get('status') else None
+        kind = _enum_from_value(_KIND_BY_VALUE, Kind, data['kind'])
+        file = _enum_from_value(_FILE_BY_VALUE, File, data['file'])
+        status = _enum_from_value(_STATUS_BY_VALUE, Status, data['status']) if data.get('status') else None
 
         return cls(
             id=data['id'],
@@ -119,27 +154,46 @@ class DocElement:
 
     def to_json(self) -> str:
         """Serialize to JSON string."""
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2).decode('utf-8')
         return json.dumps(self.to_dict(), indent=2)
 
     @classmethod
     def from_json(cls, json_str: str) -> 'DocElement':
         """Deserialize from JSON string."""
-        data = json.loads(json_str)
+        if ORJSON_AVAILABLE:
+            data = orjson.loads(json_str)
+        else:
+            data = json.loads(json_str)
         return cls.from_dict(data)
 
     def add_reference(self, ref_id: str) -> None:
         """Add a reference to another element (if not already present)."""
-        if ref_id not in self.refs:
-            self.refs.append(ref_id)
+        refs = self.refs
+        synced_list, synced_len = self._refs_synced
+        if synced_list is not refs or synced_len != len(refs):
+            self._refs_set = set(refs)
+
+        if ref_id not in self._refs_set:
+            self._refs_set.add(ref_id)
+            refs.append(ref_id)
+        self._refs_synced = (refs, len(refs))
 
     def add_backlink(self, ref_id: str) -> None:
         """Add a backlink from another element (if not already present)."""
-        if ref_id not in self.backlinks:
-            self.backlinks.append(ref_id)
+        backlinks = self.backlinks
+        synced_list, synced_len = self._backlinks_synced
+        if synced_list is not backlinks or synced_len != len(backlinks):
+            self._backlinks_set = set(backlinks)
+
+        if ref_id not in self._backlinks_set:
+            self._backlinks_set.add(ref_id)
+            backlinks.append(ref_id)
+        self._backlinks_synced = (backlinks, len(backlinks))
 
     def is_task(self) -> bool:
         """Check if this element is a task."""
-        return self.kind == Kind.TASK
+        return self.kind is Kind.TASK
 
     def __str__(self) -> str:
         """String representation showing key element info."""
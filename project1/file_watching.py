@@ -6,14 +6,55 @@ and triggering re-parsing when files are modified, added, or deleted.
 """
 
 import os
+import selectors
+import stat as stat_module
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Callable, Optional, Dict, Set
+from typing import List, Callable, Iterator, Optional, Dict, Set, Tuple
 from dataclasses import dataclass
 from enum import Enum
 from threading import Thread, Event, Lock
 import hashlib
 
+# Use BLAKE3 for faster change-detection hashing if available
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+# Use msgpack for compact binary event serialization if available
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+# Suffix identifying the markdown files the watchers report
+MARKDOWN_SUFFIX = '.md'
+
+# Checksums are 128-bit hex digests (32 characters) regardless of the hash used
+CHECKSUM_HEX_LENGTH = 32
+
+# A directory listing or file checksum is reused while the mtime is unchanged, but
+# only once that mtime is this old: filesystems stamp with a coarse clock, so a
+# change in the same tick as a scan could otherwise leave the mtime unchanged
+DIR_MTIME_SETTLE_NS = 1_000_000_000
+
+# Keys every recorded file state carries (see PollingFileWatcher._file_state_from_stat)
+STATE_KEYS = frozenset({'size', 'mtime', 'mtime_ns', 'ino', 'checksum', 'is_file'})
+
+
+def _has_markdown_suffix(path: str) -> bool:
+    """
+    Check a path or file name for the markdown suffix, ignoring case.
+
+    Works on the string directly: building a Path just to read .suffix costs
+    far more than the comparison, and this runs for every reported event.
+    """
+    return path[-len(MARKDOWN_SUFFIX):].lower() == MARKDOWN_SUFFIX
+
 
 class FileEventType(Enum):
     """Types of file system events."""
@@ -23,12 +64,13 @@ class FileEventType(Enum):
     MOVED = "moved"
 
 
-@dataclass
+@dataclass(slots=True)
 class FileSystemEvent:
     """
     Represents a file system event (D:FileSystemEvent).
 
     Contains information about file changes that may require re-indexing.
+    Slotted, since a scan of a large tree can produce one per file.
     """
     event_type: FileEventType     # Type of file system event
     file_path: Path              # Path to the affected file
@@ -51,6 +93,38 @@ class FileSystemEvent:
         else:
             return f"{event_desc}: {self.file_path}"
 
+    def to_msgpack(self) -> bytes:
+        """Serialize to compact msgpack bytes (for persisting or replaying events)."""
+        if not MSGPACK_AVAILABLE:
+            raise FileWatcherError("msgpack is required for binary event serialization")
+
+        return msgpack.packb({
+            'type': self.event_type.value,
+            'path': str(self.file_path),
+            'dir': self.is_directory,
+            'ts': self.timestamp,
+            'src': str(self.src_path) if self.src_path else None,
+            'size': self.size_bytes,
+            'cs': self.checksum,
+        })
+
+    @classmethod
+    def from_msgpack(cls, data: bytes) -> 'FileSystemEvent':
+        """Deserialize from msgpack bytes produced by to_msgpack."""
+        if not MSGPACK_AVAILABLE:
+            raise FileWatcherError("msgpack is required for binary event serialization")
+
+        fields = msgpack.unpackb(data)
+        return cls(
+            event_type=FileEventType(fields['type']),
+            file_path=Path(fields['path']),
+            is_directory=fields['dir'],
+            timestamp=fields['ts'],
+            src_path=Path(fields['src']) if fields['src'] else None,
+            size_bytes=fields['size'],
+            checksum=fields['cs']
+        )
+
 
 class FileWatcherError(Exception):
     """Exception raised when file watching fails."""
@@ -99,65 +173,208 @@ class PollingFileWatcher(FileSystemWatcher):
         self.poll_interval = poll_interval
         self.watch_paths: Set[Path] = set()
         self.event_handlers: List[Callable[[FileSystemEvent], None]] = []
+        self.batch_handlers: List[Callable[[List[FileSystemEvent]], None]] = []
         self.file_states: Dict[Path, Dict] = {}  # Track file states
+        self._root_files: Dict[Path, Set[Path]] = {}  # Files last seen under each watch path
+        # Per watch path: directory -> (trusted mtime_ns or None, markdown names, subdirectories)
+        self._dir_listings: Dict[Path, Dict[str, Tuple[Optional[int], List[str], List[str]]]] = {}
 
         self._watch_thread: Optional[Thread] = None
+        self._hash_executor: Optional[ThreadPoolExecutor] = None
         self._stop_event = Event()
-        self._lock = Lock()
+        self._lock = Lock()       # Guards handler lists, watch paths and thread state
+        self._scan_lock = Lock()  # Serializes scans, which mutate file_states
         self._is_watching = False
 
     def _calculate_file_checksum(self, file_path: Path) -> Optional[str]:
-        """Calculate file content checksum for change detection."""
+        """
+        Calculate file content checksum for change detection.
+
+        The checksum only detects changes and is not a security boundary, so the
+        fastest available hash is used: BLAKE3 (SIMD) when installed, otherwise
+        SHA-256, which OpenSSL accelerates with the CPU's SHA extensions.
+        """
         try:
-            if not file_path.exists() or not file_path.is_file():
+            if not file_path.is_file():
                 return None
 
-            hasher = hashlib.md5()
+            # file_digest reads into one reused buffer outside Python bytecode.
+            # Buffered reads rather than mmap: a file truncated by another process
+            # while mapped raises SIGBUS, which would kill the whole process
             with open(file_path, 'rb') as f:
-                # Read in chunks to handle large files
-                for chunk in iter(lambda: f.read(8192), b""):
-                    hasher.update(chunk)
-            return hasher.hexdigest()
+                hasher = hashlib.file_digest(f, blake3.blake3 if BLAKE3_AVAILABLE else hashlib.sha256)
+            return hasher.hexdigest()[:CHECKSUM_HEX_LENGTH]
         except (OSError, PermissionError):
             return None
 
-    def _get_file_state(self, file_path: Path) -> Optional[Dict]:
-        """Get current file state (size, mtime, checksum)."""
-        try:
-            if not file_path.exists():
-                return None
+    def _get_file_state(self, file_path: Path, previous_state: Optional[Dict] = None) -> Optional[Dict]:
+        """
+        Get current file state (size, mtime, checksum).
 
-            stat = file_path.stat()
-            return {
-                'size': stat.st_size,
-                'mtime': stat.st_mtime,
-                'checksum': self._calculate_file_checksum(file_path),
-                'is_file': file_path.is_file()
-            }
+        If previous_state has the same (mtime_ns, size) as the file on disk, its
+        checksum is reused instead of re-reading and hashing the file.
+        """
+        try:
+            # A missing file raises FileNotFoundError, so no separate exists() check
+            return self._file_state_from_stat(file_path, file_path.stat(), previous_state)
         except (OSError, PermissionError):
             return None
 
+    def _file_state_from_stat(self, file_path: Path, stat: os.stat_result,
+                              previous_state: Optional[Dict]) -> Dict:
+        """
+        Build file state from an existing stat result, hashing only if needed.
+
+        An unchanged stat reuses the recorded checksum. A changed size already
+        proves the content changed, so the file is not read; its checksum is
+        recorded as None until a later same-size change needs one. Both
+        shortcuts need an mtime older than DIR_MTIME_SETTLE_NS: a file written
+        within the current tick is hashed, and hashed again on the next scan.
+        """
+        settled = time.time_ns() - stat.st_mtime_ns >= DIR_MTIME_SETTLE_NS
+        if self._stat_unchanged(stat, previous_state):
+            checksum = previous_state['checksum']
+        elif settled and previous_state is not None and previous_state['size'] != stat.st_size:
+            checksum = None
+        else:
+            checksum = self._calculate_file_checksum(file_path)
+
+        return {
+            'size': stat.st_size,
+            'mtime': stat.st_mtime,
+            'mtime_ns': stat.st_mtime_ns,
+            'ino': stat.st_ino,
+            'checksum': checksum,
+            'is_file': stat_module.S_ISREG(stat.st_mode),
+            'settled': settled
+        }
+
+    @staticmethod
+    def _stat_unchanged(stat: os.stat_result, previous_state: Optional[Dict]) -> bool:
+        """
+        Check whether a file's (mtime_ns, size, inode) match its previously recorded state.
+
+        The inode catches editors that save by renaming a new file over the old
+        one, which can leave mtime and size unchanged. A state recorded before
+        its mtime had settled never matches, since a same-size rewrite in the
+        same timestamp tick would leave the whole stat unchanged.
+        """
+        return (previous_state is not None and
+                previous_state.get('settled', False) and
+                previous_state['mtime_ns'] == stat.st_mtime_ns and
+                previous_state['size'] == stat.st_size and
+                previous_state['ino'] == stat.st_ino)
+
+    def _get_file_states(self, changed_files: List[Tuple[Path, Optional[Dict]]]) -> List[Optional[Dict]]:
+        """
+        Get current states for (file_path, previous_state) pairs, in parallel while watching.
+
+        Hashing releases the GIL, so the pool overlaps disk reads with hashing
+        when many files change at once.
+        """
+        executor = self._hash_executor
+        if executor is None or len(changed_files) < 2:
+            return [self._get_file_state(file_path, previous_state)
+                    for file_path, previous_state in changed_files]
+        return list(executor.map(lambda item: self._get_file_state(*item), changed_files))
+
+    def _iter_markdown_files(self, directory: Path) -> Iterator[Tuple[str, os.stat_result]]:
+        """
+        Yield (path, stat) for markdown files under directory, recursively.
+
+        Adding, removing or renaming an entry changes its directory's mtime, so
+        a directory whose mtime matches the previous scan is not listed again:
+        its known markdown files and subdirectories are reused and only stat'ed.
+        Directories that cannot be listed are skipped, as Path.rglob does, so
+        one unreadable directory does not abort the scan.
+        """
+        scan_start_ns = time.time_ns()
+        previous_listings = self._dir_listings.get(directory, {})
+        listings = {}
+        pending = [str(directory)]
+
+        while pending:
+            dir_path = pending.pop()
+            try:
+                dir_mtime_ns = os.stat(dir_path).st_mtime_ns
+            except OSError:
+                continue
+
+            listing = previous_listings.get(dir_path)
+            if listing is None or listing[0] != dir_mtime_ns:
+                listing = self._list_directory(dir_path, dir_mtime_ns, scan_start_ns)
+                if listing is None:
+                    continue
+            listings[dir_path] = listing
+
+            _, file_names, subdir_paths = listing
+            pending.extend(subdir_paths)
+            for file_name in file_names:
+                file_path = os.path.join(dir_path, file_name)
+                try:
+                    yield file_path, os.stat(file_path)
+                except OSError:
+                    continue  # File vanished or became unreadable mid-scan
+
+        self._dir_listings[directory] = listings
+
+    @staticmethod
+    def _list_directory(dir_path: str, dir_mtime_ns: int,
+                        scan_start_ns: int) -> Optional[Tuple[Optional[int], List[str], List[str]]]:
+        """
+        List a directory's markdown file names and subdirectories, or None if unreadable.
+
+        Names are filtered before anything is stat'ed, and symlinked directories
+        are not followed, which avoids cycles. The mtime is only recorded for
+        reuse once it is older than DIR_MTIME_SETTLE_NS.
+        """
+        file_names = []
+        subdir_paths = []
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdir_paths.append(entry.path)
+                    elif entry.name.endswith(MARKDOWN_SUFFIX) and entry.is_file():
+                        file_names.append(entry.name)
+        except OSError:
+            return None
+
+        settled = scan_start_ns - dir_mtime_ns >= DIR_MTIME_SETTLE_NS
+        return (dir_mtime_ns if settled else None), file_names, subdir_paths
+
     def _scan_directory(self, directory: Path) -> None:
-        """Scan directory for changes and generate events."""
+        """Scan directory for changes and emit the resulting events as one batch."""
+        self._emit_events(self._collect_changes(directory))
+
+    def _collect_changes(self, directory: Path) -> List[FileSystemEvent]:
+        """Scan directory for changes, update file states, and return the events."""
+        events: List[FileSystemEvent] = []
         if not directory.exists() or not directory.is_dir():
-            return
+            return events
 
         try:
             # Get current files
             current_files = set()
+            changed_files = []
 
-            # Scan for markdown files recursively
-            for file_path in directory.rglob("*.md"):
-                if file_path.is_file():
-                    current_files.add(file_path)
+            # Scan for markdown files recursively; files whose stat is unchanged
+            # keep their state and need no further work
+            for path, stat in self._iter_markdown_files(directory):
+                file_path = Path(path)
+                current_files.add(file_path)
 
-            # Check for new or modified files
-            for file_path in current_files:
-                current_state = self._get_file_state(file_path)
                 previous_state = self.file_states.get(file_path)
+                if not self._stat_unchanged(stat, previous_state):
+                    changed_files.append((file_path, previous_state))
 
+            current_states = self._get_file_states(changed_files)
+            # Events from one scan share a single detection time
+            scan_time = time.time()
+
+            for (file_path, previous_state), current_state in zip(changed_files, current_states):
                 if current_state is None:
-                    continue
+                    continue  # File vanished or became unreadable mid-scan
 
                 if previous_state is None:
                     # New file
@@ -165,63 +382,99 @@ class PollingFileWatcher(FileSystemWatcher):
                         event_type=FileEventType.CREATED,
                         file_path=file_path,
                         is_directory=False,
-                        timestamp=time.time(),
+                        timestamp=scan_time,
                         size_bytes=current_state['size'],
                         checksum=current_state['checksum']
                     )
-                    self._emit_event(event)
+                    events.append(event)
 
-                elif (current_state['mtime'] != previous_state['mtime'] or
+                elif (current_state['checksum'] is None or
                       current_state['checksum'] != previous_state['checksum']):
-                    # Modified file
+                    # Modified file (size changed, or content hash differs); a stat
+                    # change with identical content (touch) only refreshes the state
                     event = FileSystemEvent(
                         event_type=FileEventType.MODIFIED,
                         file_path=file_path,
                         is_directory=False,
-                        timestamp=time.time(),
+                        timestamp=scan_time,
                         size_bytes=current_state['size'],
                         checksum=current_state['checksum']
                     )
-                    self._emit_event(event)
+                    events.append(event)
 
                 # Update stored state
                 self.file_states[file_path] = current_state
 
-            # Check for deleted files
-            previous_files = set(self.file_states.keys())
-            deleted_files = previous_files - current_files
+            # Check for deleted files, only among those previously seen under this directory
+            deleted_files = self._root_files.get(directory, set()) - current_files
+            self._root_files[directory] = current_files
 
             for file_path in deleted_files:
+                if self.file_states.pop(file_path, None) is None:
+                    continue  # Seen but vanished before its state was recorded
+
                 event = FileSystemEvent(
                     event_type=FileEventType.DELETED,
                     file_path=file_path,
                     is_directory=False,
-                    timestamp=time.time()
+                    timestamp=scan_time
                 )
-                self._emit_event(event)
-                del self.file_states[file_path]
+                events.append(event)
 
         except (OSError, PermissionError) as e:
             # Log error but continue watching
             print(f"Warning: Error scanning directory {directory}: {e}")
 
+        return events
+
     def _emit_event(self, event: FileSystemEvent) -> None:
         """Emit event to all registered handlers."""
+        self._emit_events([event])
+
+    def _emit_events(self, events: List[FileSystemEvent]) -> None:
+        """
+        Emit a batch of events.
+
+        Per-event handlers are called once per event; batch handlers are called
+        once with the whole list.
+        """
+        if not events:
+            return
+
+        # Dispatch outside the lock so handlers may (un)register handlers or
+        # call back into the watcher without deadlocking
         with self._lock:
-            for handler in self.event_handlers:
+            event_handlers = list(self.event_handlers)
+            batch_handlers = list(self.batch_handlers)
+
+        for event in events:
+            for handler in event_handlers:
                 try:
                     handler(event)
                 except Exception as e:
                     print(f"Warning: Event handler failed: {e}")
 
+        for batch_handler in batch_handlers:
+            try:
+                batch_handler(events)
+            except Exception as e:
+                print(f"Warning: Batch event handler failed: {e}")
+
     def _watch_loop(self) -> None:
         """Main watching loop that runs in background thread."""
         while not self._stop_event.wait(self.poll_interval):
-            with self._lock:
-                watch_paths = self.watch_paths.copy()
+            self._poll_once()
 
+    def _poll_once(self) -> None:
+        """Scan every watched path and deliver what changed as a single batch."""
+        with self._lock:
+            watch_paths = self.watch_paths.copy()
+
+        events: List[FileSystemEvent] = []
+        with self._scan_lock:
             for path in watch_paths:
-                self._scan_directory(path)
+                events.extend(self._collect_changes(path))
+        self._emit_events(events)
 
     def add_event_handler(self, handler: Callable[[FileSystemEvent], None]) -> None:
         """Add a callback handler for file system events."""
@@ -235,6 +488,18 @@ class PollingFileWatcher(FileSystemWatcher):
             if handler in self.event_handlers:
                 self.event_handlers.remove(handler)
 
+    def add_batch_handler(self, handler: Callable[[List[FileSystemEvent]], None]) -> None:
+        """Add a callback that receives all events detected in one poll as a list."""
+        with self._lock:
+            if handler not in self.batch_handlers:
+                self.batch_handlers.append(handler)
+
+    def remove_batch_handler(self, handler: Callable[[List[FileSystemEvent]], None]) -> None:
+        """Remove a batch event callback."""
+        with self._lock:
+            if handler in self.batch_handlers:
+                self.batch_handlers.remove(handler)
+
     def start_watching(self, path: str) -> None:
         """Start watching a directory for file changes."""
         watch_path = Path(path).resolve()
@@ -245,11 +510,30 @@ class PollingFileWatcher(FileSystemWatcher):
         if not watch_path.is_dir():
             raise FileWatcherError(f"Watch path is not a directory: {watch_path}")
 
+        # Hash pool lives as long as the watcher; the initial scan uses it too.
+        # With a single CPU the pool only adds dispatch overhead, so hash serially.
+        cpu_count = os.cpu_count() or 1
         with self._lock:
-            self.watch_paths.add(watch_path)
+            if self._hash_executor is None and cpu_count > 1:
+                self._hash_executor = ThreadPoolExecutor(
+                    max_workers=cpu_count,
+                    thread_name_prefix="file-watcher-hash"
+                )
 
-            # Initial scan to populate file states
-            self._scan_directory(watch_path)
+        # Baseline scan to populate file states. Files that already exist are not
+        # reported as created, matching the watchdog backend; the watch thread
+        # sleeps a full poll interval before its first scan. Runs before the path
+        # is added to watch_paths so the watch thread cannot scan it concurrently.
+        with self._scan_lock:
+            self._collect_changes(watch_path)
+            # Forget states loaded from a snapshot for files deleted since it was saved
+            current_files = self._root_files.get(watch_path, set())
+            for file_path in [p for p in self.file_states
+                              if p not in current_files and p.is_relative_to(watch_path)]:
+                del self.file_states[file_path]
+
+        with self._lock:
+            self.watch_paths.add(watch_path)
 
             # Start watch thread if not already running
             if not self._is_watching:
@@ -264,12 +548,25 @@ class PollingFileWatcher(FileSystemWatcher):
             if self._is_watching:
                 self._stop_event.set()
                 self._is_watching = False
+            watch_thread = self._watch_thread
+            self._watch_thread = None
 
-            if self._watch_thread and self._watch_thread.is_alive():
-                self._watch_thread.join(timeout=5.0)
+        # Join without holding the lock: the thread takes it while emitting events
+        if watch_thread and watch_thread.is_alive():
+            watch_thread.join(timeout=5.0)
 
+        with self._lock:
             self.watch_paths.clear()
+            hash_executor = self._hash_executor
+            self._hash_executor = None
+
+        if hash_executor is not None:
+            hash_executor.shutdown(wait=True)
+
+        with self._scan_lock:
             self.file_states.clear()
+            self._root_files.clear()
+            self._dir_listings.clear()
 
     def is_watching(self) -> bool:
         """Check if watcher is currently active."""
@@ -280,6 +577,51 @@ class PollingFileWatcher(FileSystemWatcher):
         with self._lock:
             return list(self.watch_paths)
 
+    def save_state(self, path: str) -> None:
+        """
+        Save recorded file states to a snapshot file (requires msgpack).
+
+        A watcher that loads the snapshot before start_watching skips hashing
+        every file whose stat still matches. Call before stop_watching, which
+        clears the states. The snapshot is written to a temporary file and
+        renamed into place, so concurrent readers never see a partial write.
+        """
+        if not MSGPACK_AVAILABLE:
+            raise FileWatcherError("msgpack is required to save watcher state")
+
+        with self._scan_lock:
+            snapshot = {str(file_path): state for file_path, state in self.file_states.items()}
+
+        snapshot_path = Path(path)
+        snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = snapshot_path.with_name(f"{snapshot_path.name}.{os.getpid()}.tmp")
+        temp_path.write_bytes(msgpack.packb(snapshot))
+        os.replace(temp_path, snapshot_path)
+
+    def load_state(self, path: str) -> None:
+        """
+        Load file states saved by save_state (requires msgpack).
+
+        Raises:
+            FileNotFoundError: If the snapshot file does not exist.
+            FileWatcherError: If msgpack is missing or the snapshot is malformed.
+        """
+        if not MSGPACK_AVAILABLE:
+            raise FileWatcherError("msgpack is required to load watcher state")
+
+        snapshot_bytes = Path(path).read_bytes()
+        try:
+            snapshot = msgpack.unpackb(snapshot_bytes)
+            file_states = {Path(file_path): dict(state) for file_path, state in snapshot.items()}
+            for state in file_states.values():
+                if not STATE_KEYS <= state.keys():
+                    raise ValueError(f"missing keys {sorted(STATE_KEYS - state.keys())}")
+        except (ValueError, TypeError, AttributeError) as e:
+            raise FileWatcherError(f"Invalid watcher state snapshot {path}: {e}")
+
+        with self._scan_lock:
+            self.file_states.update(file_states)
+
 
 # Try to use watchdog library for better performance if available
 try:
@@ -310,8 +652,7 @@ if WATCHDOG_AVAILABLE:
                 if event.is_directory:
                     return False
 
-                path = Path(event.src_path)
-                return path.suffix.lower() == '.md'
+                return _has_markdown_suffix(os.fsdecode(event.src_path))
 
             def on_created(self, event):
                 if self._should_process_event(event):
@@ -364,12 +705,16 @@ if WATCHDOG_AVAILABLE:
 
         def _emit_event(self, event: FileSystemEvent) -> None:
             """Emit event to all registered handlers."""
+            # Dispatch outside the lock: stop_watching() waits on the observer
+            # thread, which runs this method
             with self._lock:
-                for handler in self.event_handlers:
-                    try:
-                        handler(event)
-                    except Exception as e:
-                        print(f"Warning: Event handler failed: {e}")
+                event_handlers = list(self.event_handlers)
+
+            for handler in event_handlers:
+                try:
+                    handler(event)
+                except Exception as e:
+                    print(f"Warning: Event handler failed: {e}")
 
         def add_event_handler(self, handler: Callable[[FileSystemEvent], None]) -> None:
             """Add a callback handler for file system events."""
@@ -410,11 +755,14 @@ if WATCHDOG_AVAILABLE:
         def stop_watching(self) -> None:
             """Stop watching for file changes."""
             with self._lock:
-                # Unschedule all watches
-                for watch_handle, _ in self.watch_handles:
-                    self.observer.unschedule(watch_handle)
+                watch_handles = list(self.watch_handles)
                 self.watch_handles.clear()
 
+            # Unschedule all watches without holding the lock; unschedule waits
+            # for the observer, whose thread may be emitting an event
+            for watch_handle, _ in watch_handles:
+                self.observer.unschedule(watch_handle)
+
             # Stop observer
             if self.observer.is_alive():
                 self.observer.stop()
@@ -430,6 +778,129 @@ if WATCHDOG_AVAILABLE:
                 return [path for _, path in self.watch_handles]
 
 
+# Use inotify through inotify_simple for low-latency polling on Linux if available
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+    INOTIFY_AVAILABLE = True
+except ImportError:
+    INOTIFY_AVAILABLE = False
+
+if INOTIFY_AVAILABLE:
+    class InotifyFileWatcher(PollingFileWatcher):
+        """
+        inotify-triggered file system watcher for Linux.
+
+        Detects changes exactly like PollingFileWatcher, but scans when the kernel
+        reports activity in a watched directory instead of on a timer, so changes
+        are seen within milliseconds without the full watchdog dependency. Only
+        the watch paths containing the changed directories are rescanned.
+        """
+
+        WATCH_MASK = (inotify_flags.CREATE | inotify_flags.MODIFY | inotify_flags.DELETE |
+                      inotify_flags.MOVED_FROM | inotify_flags.MOVED_TO)
+
+        def __init__(self, poll_interval: float = 1.0):
+            """
+            Initialize inotify watcher.
+
+            Args:
+                poll_interval: Accepted for compatibility with PollingFileWatcher;
+                    scans are triggered by inotify events, not a timer.
+            """
+            super().__init__(poll_interval=poll_interval)
+            self._inotify: Optional[INotify] = None
+            self._wake_fd: Optional[int] = None  # eventfd that interrupts the blocking wait on stop
+            self._watch_descriptors: Dict[int, Tuple[Path, Path]] = {}  # wd -> (directory, watch root)
+
+        def _add_watches(self, directory: Path, root: Path) -> None:
+            """Watch directory and every subdirectory below it (symlinks not followed)."""
+            for dir_path, dir_names, _ in os.walk(directory):
+                try:
+                    descriptor = self._inotify.add_watch(dir_path, self.WATCH_MASK)
+                except OSError:
+                    dir_names.clear()  # Unreadable or already gone; skip its subtree
+                    continue
+                self._watch_descriptors[descriptor] = (Path(dir_path), root)
+
+        def _watch_loop(self) -> None:
+            """Block on inotify and rescan the watch roots whose directories changed."""
+            inotify = self._inotify
+
+            with selectors.DefaultSelector() as selector:
+                selector.register(inotify.fileno(), selectors.EVENT_READ)
+                selector.register(self._wake_fd, selectors.EVENT_READ)
+
+                while not self._stop_event.is_set():
+                    selector.select()
+                    if self._stop_event.is_set():
+                        break
+
+                    with self._lock:
+                        watch_paths = self.watch_paths.copy()
+
+                    events: List[FileSystemEvent] = []
+                    with self._scan_lock:
+                        changed_roots = set()
+                        for inotify_event in inotify.read(timeout=0):
+                            if inotify_event.mask & inotify_flags.Q_OVERFLOW:
+                                changed_roots = watch_paths  # Events were lost; rescan everything
+                                continue
+
+                            watched = self._watch_descriptors.get(inotify_event.wd)
+                            if watched is None:
+                                continue
+                            parent, root = watched
+                            changed_roots.add(root)
+
+                            if inotify_event.mask & inotify_flags.IGNORED:
+                                del self._watch_descriptors[inotify_event.wd]
+                            elif (inotify_event.mask & inotify_flags.ISDIR and
+                                  inotify_event.mask & (inotify_flags.CREATE | inotify_flags.MOVED_TO)):
+                                # New directories need their own watches
+                                self._add_watches(parent / inotify_event.name, root)
+
+                        for root in changed_roots & watch_paths:
+                            events.extend(self._collect_changes(root))
+                    self._emit_events(events)
+
+        def start_watching(self, path: str) -> None:
+            """Start watching a directory for file changes."""
+            with self._lock:
+                if self._inotify is None:
+                    self._inotify = INotify()
+                    self._wake_fd = os.eventfd(0, os.EFD_CLOEXEC)
+
+            super().start_watching(path)
+
+            watch_path = Path(path).resolve()
+            with self._scan_lock:
+                self._add_watches(watch_path, watch_path)
+                # Catch changes made between the baseline scan and the watches existing
+                events = self._collect_changes(watch_path)
+            self._emit_events(events)
+
+        def stop_watching(self) -> None:
+            """Stop watching for file changes."""
+            with self._lock:
+                self._stop_event.set()
+                if self._wake_fd is not None:
+                    os.eventfd_write(self._wake_fd, 1)
+
+            # Joins the watch thread, which the wake-up above has released
+            super().stop_watching()
+
+            with self._lock:
+                inotify, self._inotify = self._inotify, None
+                wake_fd, self._wake_fd = self._wake_fd, None
+            if inotify is not None:
+                inotify.close()
+            if wake_fd is not None:
+                os.close(wake_fd)
+
+            with self._scan_lock:
+                self._watch_descriptors.clear()
+
+
 class WorkspaceFileWatcher:
     """
     High-level workspace file watcher for Project1.
@@ -443,12 +914,17 @@ class WorkspaceFileWatcher:
         Initialize workspace file watcher.
 
         Args:
-            use_watchdog: Whether to use watchdog library if available.
+            use_watchdog: Whether to use watchdog library if available. Without
+                watchdog, inotify-triggered scanning is used where available
+                (Linux with inotify_simple), otherwise timed polling.
         """
         # Choose watcher implementation
         if use_watchdog and WATCHDOG_AVAILABLE:
             self.watcher = WatchdogFileWatcher()
             self.watcher_type = "watchdog"
+        elif INOTIFY_AVAILABLE:
+            self.watcher = InotifyFileWatcher(poll_interval=2.0)
+            self.watcher_type = "inotify"
         else:
             self.watcher = PollingFileWatcher(poll_interval=2.0)
             self.watcher_type = "polling"
@@ -464,7 +940,7 @@ class WorkspaceFileWatcher:
     def _handle_file_event(self, event: FileSystemEvent) -> None:
         """Handle file system events and trigger change handlers."""
         # Filter for markdown files in watched projects
-        if not event.file_path.suffix.lower() == '.md':
+        if not _has_markdown_suffix(event.file_path.name):
             return
 
         # Check if file is in a watched project
@@ -542,7 +1018,8 @@ class WorkspaceFileWatcher:
             'is_watching': self.watcher.is_watching(),
             'watched_projects': [str(p) for p in self.watched_projects],
             'num_change_handlers': len(self.change_handlers),
-            'watchdog_available': WATCHDOG_AVAILABLE
+            'watchdog_available': WATCHDOG_AVAILABLE,
+            'inotify_available': INOTIFY_AVAILABLE
         }
 
 
@@ -5,9 +5,11 @@ This module implements ID extraction functionality as specified in T:0004,
 following R:IDConvention for parsing structured document elements.
 """
 
+import os
 import re
+import time
 from dataclasses import dataclass
-from typing import List, Optional, Set, Dict
+from typing import List, Optional, Set, Dict, Tuple
 from enum import Enum
 
 
@@ -23,10 +25,24 @@ class IDPrefix(Enum):
     TEST = "TP:"
 
 
-@dataclass
+# Case-insensitive prefix lookup, built once rather than re-read from the enum
+# for every heading
+_PREFIX_BY_LOWER = {prefix.value.lower(): prefix for prefix in IDPrefix}
+
+# Prefixes whose suffix may start with a digit (e.g. T:0001, TP:0001)
+_NUMERIC_SUFFIX_PREFIXES = ("T:", "TP:")
+
+# Characters allowed in an ID suffix: \w is exactly str.isalnum() plus '_'
+_SUFFIX_CHARS_PATTERN = re.compile(r'[\w-]+')
+
+
+@dataclass(frozen=True)
 class ExtractedID:
     """
     Represents an ID extracted from a markdown heading.
+
+    Frozen, since extract_ids_from_file hands the same cached instances to
+    every caller.
     """
     # ID components
     full_id: str                    # Complete ID (e.g., "R:Purpose")
@@ -73,25 +89,23 @@ class IDValidator:
         if not id_string:
             return False
 
-        # Check if ID starts with valid prefix (case insensitive)
-        valid_prefixes = [prefix.value for prefix in IDPrefix]
-
-        for prefix in valid_prefixes:
-            if id_string.lower().startswith(prefix.lower()):
-                actual_prefix = id_string[:len(prefix)]  # Preserve original case
-                suffix = id_string[len(prefix):]
-                # Suffix must be non-empty and contain valid characters
-                if suffix and self._is_valid_suffix(suffix, actual_prefix):
-                    return True
+        # Every prefix ends at its only colon, so the text up to the first colon
+        # is the one candidate prefix (case insensitive)
+        colon_index = id_string.find(':')
+        actual_prefix = id_string[:colon_index + 1]  # Preserve original case
+        if colon_index < 0 or actual_prefix.lower() not in _PREFIX_BY_LOWER:
+            return False
 
-        return False
+        # Suffix must be non-empty and contain valid characters
+        suffix = id_string[colon_index + 1:]
+        return bool(suffix) and self._is_valid_suffix(suffix, actual_prefix)
 
     def _is_valid_suffix(self, suffix: str, prefix: str = "") -> bool:
         """Check if ID suffix contains valid characters."""
         # Allow alphanumeric, underscores, and hyphens
         # For task (T:) and test (TP:) IDs, allow numeric suffixes
         # For other IDs, must start with letter
-        if prefix in ["T:", "TP:"]:
+        if prefix in _NUMERIC_SUFFIX_PREFIXES:
             # Tasks and tests can start with numbers (e.g., T:0001, TP:0001)
             if not suffix[0].isalnum():
                 return False
@@ -100,7 +114,7 @@ class IDValidator:
             if not suffix[0].isalpha():
                 return False
 
-        return all(c.isalnum() or c in ['_', '-'] for c in suffix)
+        return _SUFFIX_CHARS_PATTERN.fullmatch(suffix) is not None
 
     def check_uniqueness(self, id_string: str) -> bool:
         """
@@ -124,14 +138,30 @@ class IDValidator:
         return []
 
 
+# Maximum number of files whose extracted IDs are kept in memory
+FILE_ID_CACHE_LIMIT = 2000
+
+# A file's IDs are only cached once its mtime is this old: filesystems stamp
+# with a coarse clock, so a same-size edit in the same tick as a read could
+# otherwise leave the whole cache key unchanged (as file_watching does for
+# directory listings)
+FILE_MTIME_SETTLE_NS = 1_000_000_000
+
+# Extracted IDs per file, keyed on (absolute path, mtime_ns, size, inode)
+_file_id_cache: Dict[Tuple[str, int, int, int], List[ExtractedID]] = {}
+
+
 class MarkdownHeadingParser:
     """
     Parses markdown headings to extract IDs and metadata.
     """
 
-    # Regex pattern to match markdown headings with optional IDs
+    # Regex pattern to match markdown headings with optional IDs. Whitespace
+    # after the markers excludes newlines so a match never spans two lines.
+    # Matches start at the newline before the heading: a literal first
+    # character lets the engine skip ahead rather than try ^ at every offset.
     HEADING_PATTERN = re.compile(
-        r'^(#{1,6})\s+(.+?)$',  # Capture heading level and text
+        r'\n(#{1,6})[^\S\n]+(.+?)$',  # Capture heading level and text
         re.MULTILINE
     )
 
@@ -165,13 +195,17 @@ class MarkdownHeadingParser:
             ValueError: If duplicate IDs found and uniqueness validation enabled.
         """
         extracted_ids = []
-        lines = markdown_text.split('\n')
-
-        for line_num, line in enumerate(lines):
-            # Check if line is a heading
-            heading_match = self.HEADING_PATTERN.match(line)
-            if not heading_match:
-                continue
+        line_num = 0
+        line_start = 0
+
+        # One regex sweep over the whole text instead of matching line by line;
+        # line numbers advance by the newlines skipped since the last heading.
+        # The leading newline lets the pattern match a heading on the first line.
+        text = '\n' + markdown_text
+        for heading_match in self.HEADING_PATTERN.finditer(text):
+            line_num += text.count('\n', line_start, heading_match.start())
+            line_start = heading_match.start()
+            line = heading_match.group(0)[1:]  # Whole heading line, minus the newline
 
             heading_markers, heading_text = heading_match.groups()
             heading_level = len(heading_markers)  # Count # characters
@@ -187,15 +221,19 @@ class MarkdownHeadingParser:
             if extracted_id:
                 # Validate uniqueness if enabled
                 if self.validate_uniqueness:
-                    if not self.validator.check_uniqueness(extracted_id.full_id):
-                        raise ValueError(f"Duplicate ID found: {extracted_id.full_id} at line {line_num + 1}")
-
-                    self.validator.register_id(extracted_id.full_id)
+                    self._register_unique_id(extracted_id)
 
                 extracted_ids.append(extracted_id)
 
         return extracted_ids
 
+    def _register_unique_id(self, extracted_id: ExtractedID) -> None:
+        """Register an extracted ID, raising ValueError if it was already seen."""
+        if not self.validator.check_uniqueness(extracted_id.full_id):
+            raise ValueError(f"Duplicate ID found: {extracted_id.full_id} at line {extracted_id.line_number + 1}")
+
+        self.validator.register_id(extracted_id.full_id)
+
     def _extract_id_from_heading(self, heading_text: str, heading_level: int,
                                 line_number: int, raw_line: str) -> Optional[ExtractedID]:
         """
@@ -232,17 +270,8 @@ class MarkdownHeadingParser:
             return None
 
         # Map string prefix to enum (case insensitive)
-        try:
-            # Find matching enum value (case insensitive)
-            prefix_enum = None
-            for prefix in IDPrefix:
-                if prefix.value.lower() == prefix_str.lower():
-                    prefix_enum = prefix
-                    break
-
-            if prefix_enum is None:
-                return None
-        except ValueError:
+        prefix_enum = _PREFIX_BY_LOWER.get(prefix_str.lower())
+        if prefix_enum is None:
             return None
 
         return ExtractedID(
@@ -259,6 +288,11 @@ class MarkdownHeadingParser:
         """
         Extract IDs from a markdown file.
 
+        Results are cached per file and reused while its (mtime, size, inode)
+        are unchanged, so re-validating a project only re-parses edited files.
+        Files modified within FILE_MTIME_SETTLE_NS are always re-parsed. The
+        cached ExtractedID objects are frozen and shared between calls.
+
         Args:
             file_path: Path to the markdown file.
 
@@ -270,14 +304,31 @@ class MarkdownHeadingParser:
             ValueError: If duplicate IDs found and validation enabled.
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            return self.extract_ids_from_text(content)
+            stat = os.stat(file_path)
+            cache_key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size, stat.st_ino)
+            settled = time.time_ns() - stat.st_mtime_ns >= FILE_MTIME_SETTLE_NS
+
+            extracted_ids = _file_id_cache.get(cache_key) if settled else None
+            if extracted_ids is None:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+
+                # Cache the unvalidated IDs; uniqueness depends on this parser's state
+                extracted_ids = MarkdownHeadingParser(validate_uniqueness=False).extract_ids_from_text(content)
+                if settled:
+                    if len(_file_id_cache) >= FILE_ID_CACHE_LIMIT:
+                        _file_id_cache.pop(next(iter(_file_id_cache)), None)  # Evict the oldest entry
+                    _file_id_cache[cache_key] = extracted_ids
 
         except FileNotFoundError:
             raise FileNotFoundError(f"Markdown file not found: {file_path}")
 
+        if self.validate_uniqueness:
+            for extracted_id in extracted_ids:
+                self._register_unique_id(extracted_id)
+
+        return list(extracted_ids)
+
     def validate_project_uniqueness(self, file_paths: List[str]) -> Dict[str, List[str]]:
         """
         Validate ID uniqueness across multiple files in a project.
@@ -8,14 +8,22 @@ and references as specified in C:Indexer.
 from typing import Dict, List, Set, Optional, Tuple, Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
+import json
 import re
 import time
 from collections import defaultdict
 
+# Use orjson for faster serialization if available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from doc_element import DocElement, Kind, File, Status
 
 
-@dataclass
+@dataclass(slots=True)
 class IndexStatistics:
     """Statistics about the document index."""
     total_elements: int = 0
@@ -29,7 +37,7 @@ class IndexStatistics:
     last_updated: float = field(default_factory=time.time)
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchMatch:
     """Represents a search result match."""
     element_id: str
@@ -59,6 +67,9 @@ class DocumentIndex:
         # File-based mappings
         self._file_elements: Dict[str, Set[str]] = defaultdict(set)  # file -> {element_ids}
 
+        # Kind-based mappings
+        self._kind_elements: Dict[str, Set[str]] = defaultdict(set)  # kind -> {element_ids}
+
         # Reference graph structures
         self._references: Dict[str, Set[str]] = defaultdict(set)  # element_id -> {referenced_ids}
         self._backlinks: Dict[str, Set[str]] = defaultdict(set)   # element_id -> {referencing_ids}
@@ -66,7 +77,12 @@ class DocumentIndex:
         # Search index structures
         self._title_index: Dict[str, Set[str]] = defaultdict(set)  # normalized_word -> {element_ids}
         self._id_index: Dict[str, str] = {}  # normalized_id -> actual_id
-        self._partial_id_index: Dict[str, Set[str]] = defaultdict(set)  # partial_id -> {element_ids}
+        self._id_trigrams: Dict[str, Set[str]] = defaultdict(set)  # trigram of lowercased id -> {element_ids}
+        self._normalized_titles: Dict[str, str] = {}  # element_id -> normalized title
+        self._search_index_dirty = False  # Rebuilt from _elements on next query
+
+        # Serialized export, dropped whenever the index changes
+        self._export_json_cache: Optional[str] = None
 
         # Index metadata
         self._last_updated = time.time()
@@ -83,6 +99,7 @@ class DocumentIndex:
         """
         try:
             element_id = element.id
+            self._export_json_cache = None
 
             # Remove existing element if present (for updates)
             if element_id in self._elements:
@@ -95,11 +112,14 @@ class DocumentIndex:
             file_key = element.file.value
             self._file_elements[file_key].add(element_id)
 
+            # Add to kind mapping
+            self._kind_elements[element.kind.value].add(element_id)
+
             # Build reference mappings
             self._add_element_references(element)
 
-            # Update search indices
-            self._add_to_search_index(element)
+            # Search indices are rebuilt lazily on the next query
+            self._search_index_dirty = True
 
             self._last_updated = time.time()
 
@@ -121,6 +141,7 @@ class DocumentIndex:
 
         try:
             element = self._elements[element_id]
+            self._export_json_cache = None
 
             # Remove from core storage
             del self._elements[element_id]
@@ -131,11 +152,17 @@ class DocumentIndex:
             if not self._file_elements[file_key]:
                 del self._file_elements[file_key]
 
+            # Remove from kind mapping
+            kind_key = element.kind.value
+            self._kind_elements[kind_key].discard(element_id)
+            if not self._kind_elements[kind_key]:
+                del self._kind_elements[kind_key]
+
             # Remove reference mappings
             self._remove_element_references(element_id)
 
-            # Remove from search indices
-            self._remove_from_search_index(element)
+            # Search indices are rebuilt lazily on the next query
+            self._search_index_dirty = True
 
             self._last_updated = time.time()
             return True
@@ -167,6 +194,9 @@ class DocumentIndex:
         """
         return element_id in self._elements
 
+    # Support `element_id in index` without an extra method call
+    __contains__ = has_element
+
     def get_elements_by_file(self, file: File) -> List[DocElement]:
         """
         Get all elements from a specific file.
@@ -237,6 +267,7 @@ class DocumentIndex:
         if not query.strip():
             return []
 
+        self._ensure_search_index()
         query_normalized = self._normalize_for_search(query.strip())
         matches = []
 
@@ -252,51 +283,56 @@ class DocumentIndex:
                 matched_text=exact_id
             ))
 
-        # Partial ID matches
-        for partial_id, element_ids in self._partial_id_index.items():
-            if query_normalized in partial_id and query_normalized != partial_id:
-                for element_id in element_ids:
-                    if element_id in self._elements and element_id != exact_id:
-                        element = self._elements[element_id]
-                        # Score based on how much of the ID matches
-                        score = len(query_normalized) / len(partial_id)
-                        matches.append(SearchMatch(
-                            element_id=element_id,
-                            element_title=element.title,
-                            match_type='id_partial',
-                            match_score=score * 0.9,  # Slightly lower than exact
-                            matched_text=element_id
-                        ))
+        # Partial ID matches against every ID prefix of 2+ characters,
+        # checking only the IDs whose trigrams cover the query
+        for element_id in self._partial_id_candidates(query_normalized):
+            if element_id == exact_id:
+                continue
+            element = self._elements[element_id]
+            for i in range(2, len(element_id) + 1):
+                partial_id = element_id[:i].lower()
+                if query_normalized in partial_id and query_normalized != partial_id:
+                    # Score based on how much of the ID matches
+                    score = len(query_normalized) / len(partial_id)
+                    matches.append(SearchMatch(
+                        element_id=element_id,
+                        element_title=element.title,
+                        match_type='id_partial',
+                        match_score=score * 0.9,  # Slightly lower than exact
+                        matched_text=element_id
+                    ))
 
         # Title word matches
+        matched_ids = {m.element_id for m in matches}
         query_words = query_normalized.split()
         for word in query_words:
             if word in self._title_index:
                 for element_id in self._title_index[word]:
-                    if element_id in self._elements:
-                        element = self._elements[element_id]
-
-                        # Check if this is exact title match
-                        element_title_norm = self._normalize_for_search(element.title)
-                        if element_title_norm == query_normalized:
-                            score = 0.95
-                            match_type = 'title_exact'
-                        else:
-                            # Score based on word coverage
-                            title_words = element_title_norm.split()
-                            matching_words = sum(1 for w in query_words if w in title_words)
-                            score = matching_words / max(len(query_words), len(title_words))
-                            match_type = 'title_partial'
-
-                        # Avoid duplicates from multiple word matches
-                        if not any(m.element_id == element_id for m in matches):
-                            matches.append(SearchMatch(
-                                element_id=element_id,
-                                element_title=element.title,
-                                match_type=match_type,
-                                match_score=score * 0.8,  # Lower than ID matches
-                                matched_text=element.title
-                            ))
+                    # Avoid duplicates from multiple word matches
+                    if element_id in matched_ids or element_id not in self._elements:
+                        continue
+                    element = self._elements[element_id]
+
+                    # Check if this is exact title match
+                    element_title_norm = self._normalized_titles[element_id]
+                    if element_title_norm == query_normalized:
+                        score = 0.95
+                        match_type = 'title_exact'
+                    else:
+                        # Score based on word coverage
+                        title_words = element_title_norm.split()
+                        matching_words = sum(1 for w in query_words if w in title_words)
+                        score = matching_words / max(len(query_words), len(title_words))
+                        match_type = 'title_partial'
+
+                    matched_ids.add(element_id)
+                    matches.append(SearchMatch(
+                        element_id=element_id,
+                        element_title=element.title,
+                        match_type=match_type,
+                        match_score=score * 0.8,  # Lower than ID matches
+                        matched_text=element.title
+                    ))
 
         # Sort by score (descending) and return limited results
         matches.sort(key=lambda m: m.match_score, reverse=True)
@@ -309,15 +345,11 @@ class DocumentIndex:
         Returns:
             IndexStatistics with current index state.
         """
-        # Count elements by kind
-        kind_counts = defaultdict(int)
-        for element in self._elements.values():
-            kind_counts[element.kind.value] += 1
+        self._ensure_search_index()
 
-        # Count elements by file
-        file_counts = defaultdict(int)
-        for element in self._elements.values():
-            file_counts[element.file.value] += 1
+        # Element counts come straight from the kind and file buckets
+        kind_counts = {kind: len(ids) for kind, ids in self._kind_elements.items() if ids}
+        file_counts = {file: len(ids) for file, ids in self._file_elements.items() if ids}
 
         # Count references and orphans
         total_refs = sum(len(refs) for refs in self._references.values())
@@ -333,8 +365,8 @@ class DocumentIndex:
 
         return IndexStatistics(
             total_elements=len(self._elements),
-            elements_by_kind=dict(kind_counts),
-            elements_by_file=dict(file_counts),
+            elements_by_kind=kind_counts,
+            elements_by_file=file_counts,
             total_references=total_refs,
             total_backlinks=total_backlinks,
             orphaned_references=orphaned,
@@ -350,25 +382,24 @@ class DocumentIndex:
         Returns:
             Dictionary with 'broken_references' and 'missing_backlinks' lists.
         """
-        issues = {
-            'broken_references': [],
-            'missing_backlinks': []
-        }
+        broken_references = []
+        missing_backlinks = []
+        elements = self._elements
+        backlinks = self._backlinks
 
-        # Check for broken references
+        # One pass over the reference graph checks both broken references
+        # and missing backlinks (references not properly tracked)
         for element_id, refs in self._references.items():
             for ref_id in refs:
-                if ref_id not in self._elements:
-                    issues['broken_references'].append(f"{element_id} -> {ref_id}")
+                if ref_id not in elements:
+                    broken_references.append(f"{element_id} -> {ref_id}")
+                elif element_id not in backlinks.get(ref_id, ()):
+                    missing_backlinks.append(f"{ref_id} <- {element_id}")
 
-        # Check for missing backlinks (references not properly tracked)
-        for element_id, refs in self._references.items():
-            for ref_id in refs:
-                if ref_id in self._elements:
-                    if element_id not in self._backlinks.get(ref_id, set()):
-                        issues['missing_backlinks'].append(f"{ref_id} <- {element_id}")
-
-        return issues
+        return {
+            'broken_references': broken_references,
+            'missing_backlinks': missing_backlinks
+        }
 
     def get_elements_by_kind(self, kind: Kind) -> List[DocElement]:
         """
@@ -380,7 +411,8 @@ class DocumentIndex:
         Returns:
             List of DocElements of the specified kind.
         """
-        return [element for element in self._elements.values() if element.kind == kind]
+        element_ids = self._kind_elements.get(kind.value, set())
+        return [self._elements[eid] for eid in element_ids if eid in self._elements]
 
     def find_circular_references(self) -> List[List[str]]:
         """
@@ -389,32 +421,46 @@ class DocumentIndex:
         Returns:
             List of circular reference chains (each chain is a list of element IDs).
         """
-        visited = set()
-        rec_stack = set()
+        # Intern IDs to dense ints so the DFS works on int adjacency lists
+        # and a bytearray of visit states instead of string-keyed sets.
+        element_ids = list(self._elements)
+        position = {element_id: i for i, element_id in enumerate(element_ids)}
+        adjacency = [
+            [position[ref_id] for ref_id in self._references.get(element_id, ())
+             if ref_id in position]  # Only follow valid references
+            for element_id in element_ids
+        ]
+
+        UNVISITED, ON_STACK, DONE = 0, 1, 2
+        state = bytearray(len(element_ids))
+        path_position = [0] * len(element_ids)  # index in path while ON_STACK
         cycles = []
 
-        def dfs(element_id: str, path: List[str]) -> None:
-            if element_id in rec_stack:
-                # Found a cycle
-                cycle_start = path.index(element_id)
-                cycles.append(path[cycle_start:] + [element_id])
-                return
-
-            if element_id in visited:
-                return
-
-            visited.add(element_id)
-            rec_stack.add(element_id)
-
-            for ref_id in self._references.get(element_id, set()):
-                if ref_id in self._elements:  # Only follow valid references
-                    dfs(ref_id, path + [element_id])
-
-            rec_stack.remove(element_id)
-
-        for element_id in self._elements:
-            if element_id not in visited:
-                dfs(element_id, [])
+        # Iterative DFS: path holds the nodes on the current branch and
+        # stack holds the matching iterators over their remaining refs.
+        for root in range(len(element_ids)):
+            if state[root] != UNVISITED:
+                continue
+
+            state[root] = ON_STACK
+            path = [root]
+            stack = [iter(adjacency[root])]
+
+            while stack:
+                for ref in stack[-1]:
+                    if state[ref] == ON_STACK:
+                        # Found a cycle
+                        cycle = path[path_position[ref]:]
+                        cycles.append([element_ids[i] for i in cycle] + [element_ids[ref]])
+                    elif state[ref] == UNVISITED:
+                        state[ref] = ON_STACK
+                        path_position[ref] = len(path)
+                        path.append(ref)
+                        stack.append(iter(adjacency[ref]))
+                        break
+                else:
+                    stack.pop()
+                    state[path.pop()] = DONE
 
         return cycles
 
@@ -461,40 +507,50 @@ class DocumentIndex:
         id_normalized = self._normalize_for_search(element_id)
         self._id_index[id_normalized] = element_id
 
-        # Add to partial ID index (for prefix matching)
-        for i in range(2, len(element_id) + 1):  # Start from 2 chars
-            partial = element_id[:i].lower()
-            self._partial_id_index[partial].add(element_id)
+        # Add to ID trigram index (for partial matching)
+        for trigram in self._trigrams(element_id.lower()):
+            self._id_trigrams[trigram].add(element_id)
 
         # Add to title index
-        title_words = self._normalize_for_search(element.title).split()
-        for word in title_words:
+        title_normalized = self._normalize_for_search(element.title)
+        self._normalized_titles[element_id] = title_normalized
+        for word in title_normalized.split():
             if word:  # Skip empty words
                 self._title_index[word].add(element_id)
 
-    def _remove_from_search_index(self, element: DocElement) -> None:
-        """Remove element from search indices."""
-        element_id = element.id
+    def _ensure_search_index(self) -> None:
+        """Rebuild search indices from scratch if elements changed since the last build."""
+        if not self._search_index_dirty:
+            return
 
-        # Remove from ID index
-        id_normalized = self._normalize_for_search(element_id)
-        if id_normalized in self._id_index:
-            del self._id_index[id_normalized]
-
-        # Remove from partial ID index
-        for i in range(2, len(element_id) + 1):
-            partial = element_id[:i].lower()
-            self._partial_id_index[partial].discard(element_id)
-            if not self._partial_id_index[partial]:
-                del self._partial_id_index[partial]
-
-        # Remove from title index
-        title_words = self._normalize_for_search(element.title).split()
-        for word in title_words:
-            if word and word in self._title_index:
-                self._title_index[word].discard(element_id)
-                if not self._title_index[word]:
-                    del self._title_index[word]
+        self._title_index.clear()
+        self._id_index.clear()
+        self._id_trigrams.clear()
+        self._normalized_titles.clear()
+        for element in self._elements.values():
+            self._add_to_search_index(element)
+        self._search_index_dirty = False
+
+    @staticmethod
+    def _trigrams(text: str) -> Set[str]:
+        """Get the set of 3-character substrings of text."""
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+
+    def _partial_id_candidates(self, query_normalized: str) -> Iterator[str]:
+        """Get IDs that may contain the query, using the trigram index."""
+        if len(query_normalized) < 3:
+            # Too short to have trigrams; every ID is a candidate
+            return iter(self._elements)
+
+        posting_lists = []
+        for trigram in self._trigrams(query_normalized):
+            element_ids = self._id_trigrams.get(trigram)
+            if not element_ids:
+                return iter(())
+            posting_lists.append(element_ids)
+
+        posting_lists.sort(key=len)
+        return iter(set.intersection(*posting_lists))
 
     def _normalize_for_search(self, text: str) -> str:
         """Normalize text for search index."""
@@ -508,13 +564,41 @@ class DocumentIndex:
         """Clear all index data."""
         self._elements.clear()
         self._file_elements.clear()
+        self._kind_elements.clear()
         self._references.clear()
         self._backlinks.clear()
         self._title_index.clear()
         self._id_index.clear()
-        self._partial_id_index.clear()
+        self._id_trigrams.clear()
+        self._normalized_titles.clear()
+        self._search_index_dirty = False
+        self._export_json_cache = None
         self._last_updated = time.time()
 
+    def snapshot(self) -> 'DocumentIndex':
+        """
+        Create an independent copy of the index.
+
+        Elements are shared, since the index never mutates them; the
+        lookup and reference maps are copied, and the search indices are
+        rebuilt lazily on the copy's first query.
+
+        Returns:
+            New DocumentIndex with the same contents.
+        """
+        copy = DocumentIndex()
+        copy._elements = self._elements.copy()
+        for source, target in ((self._file_elements, copy._file_elements),
+                               (self._kind_elements, copy._kind_elements),
+                               (self._references, copy._references),
+                               (self._backlinks, copy._backlinks)):
+            for key, ids in source.items():
+                target[key] = set(ids)
+        copy._search_index_dirty = bool(self._elements)
+        copy._export_json_cache = self._export_json_cache
+        copy._last_updated = self._last_updated
+        return copy
+
     def get_element_count(self) -> int:
         """Get total number of indexed elements."""
         return len(self._elements)
@@ -541,13 +625,32 @@ class DocumentIndex:
             'references': {eid: list(refs) for eid, refs in self._references.items() if refs},
             'backlinks': {eid: list(backlinks) for eid, backlinks in self._backlinks.items() if backlinks},
 
-            'statistics': self.get_statistics().to_dict() if hasattr(self.get_statistics(), 'to_dict') else {
+            'statistics': {
                 'total_elements': len(self._elements),
                 'total_references': self.get_reference_count(),
                 'last_updated': self._last_updated
             }
         }
 
+    def export_reference_graph_json(self) -> str:
+        """
+        Export reference graph as a compact JSON string.
+
+        The result is cached until the index next changes, so repeated
+        exports of an unchanged index cost nothing.
+
+        Returns:
+            JSON encoding of export_reference_graph().
+        """
+        if self._export_json_cache is None:
+            graph_data = self.export_reference_graph()
+            if ORJSON_AVAILABLE:
+                self._export_json_cache = orjson.dumps(graph_data).decode('utf-8')
+            else:
+                self._export_json_cache = json.dumps(graph_data, separators=(',', ':'),
+                                                     ensure_ascii=False)
+        return self._export_json_cache
+
 
 def create_index() -> DocumentIndex:
     """
@@ -5,10 +5,12 @@ This module implements T:0007, integrating ID extraction, body extraction, and
 reference detection to create complete DocElement objects from markdown files.
 """
 
+import os
 import re
-from pathlib import Path
-from typing import List, Optional, Dict, Any
-from dataclasses import dataclass
+import sys
+from typing import List, Optional, Dict, Any, Tuple
+from dataclasses import dataclass, replace
+from collections import Counter
 
 from doc_element import DocElement, Kind, File, Status
 from id_extraction import extract_ids_from_markdown
@@ -16,14 +18,26 @@ from body_extraction import extract_all_bodies, BodyExtractionError
 from reference_detection import detect_references, ReferenceDetectionError
 
 
+# Maximum number of parsed documents kept by MarkdownParser.parse_markdown
+PARSE_CACHE_LIMIT = 64
+
+# Parsed elements per document, keyed on (File enum, markdown content)
+_parse_cache: Dict[Tuple[Optional[File], str], List[DocElement]] = {}
+
+
+def _copy_element(element: DocElement) -> DocElement:
+    """Copy a DocElement with its own refs and backlinks lists."""
+    return replace(element, refs=list(element.refs), backlinks=list(element.backlinks))
+
+
 class MarkdownParsingError(Exception):
     """Exception raised when markdown parsing fails."""
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedElement:
-    """Intermediate representation during parsing."""
+    """Intermediate representation during parsing (one per heading, so slotted)."""
     id: Optional[str]
     title: str
     heading_level: int
@@ -40,6 +54,33 @@ class MarkdownParser:
     to create complete document element representations.
     """
 
+    # Element kind for each (uppercase) ID prefix, shared by every parse
+    KIND_BY_PREFIX = {
+        'R:': Kind.REQUIREMENT,
+        'C:': Kind.COMPONENT,
+        'D:': Kind.DATA,
+        'I:': Kind.INTERFACE,
+        'M:': Kind.METHOD,
+        'UI:': Kind.UI,
+        'T:': Kind.TASK,
+        'TP:': Kind.TEST,
+    }
+
+    # File enum for each (lowercase) document file name stem
+    FILE_BY_STEM = {
+        'conventions': File.CONVENTIONS,
+        'software-design': File.SOFTWARE_DESIGN,
+        'development-plan': File.DEVELOPMENT_PLAN,
+        'test-plan': File.TEST_PLAN,
+    }
+
+    # Characters dropped from anchors: anything but word characters, whitespace and hyphens
+    ANCHOR_STRIP_PATTERN = re.compile(r'[^\w\s-]')
+
+    # Title extraction patterns: leading heading markers, and "ID - Title" headings
+    HEADING_MARKER_PATTERN = re.compile(r'^#+\s*')
+    ID_TITLE_PATTERN = re.compile(r'^([A-Za-z]+:\w+)\s*-\s*(.+)$')
+
     def __init__(self, file_path: Optional[str] = None):
         """
         Initialize parser.
@@ -55,16 +96,8 @@ class MarkdownParser:
         if not file_path:
             return None
 
-        filename = Path(file_path).stem.lower()
-
-        file_mapping = {
-            'conventions': File.CONVENTIONS,
-            'software-design': File.SOFTWARE_DESIGN,
-            'development-plan': File.DEVELOPMENT_PLAN,
-            'test-plan': File.TEST_PLAN,
-        }
-
-        return file_mapping.get(filename)
+        stem = os.path.splitext(os.path.basename(file_path))[0]
+        return self.FILE_BY_STEM.get(stem.lower())
 
     def _determine_kind_from_id(self, element_id: str) -> Kind:
         """Determine element kind from ID prefix."""
@@ -72,35 +105,23 @@ class MarkdownParser:
             return Kind.OTHER
 
         prefix = element_id.split(':', 1)[0].upper() + ':'
-
-        kind_mapping = {
-            'R:': Kind.REQUIREMENT,
-            'C:': Kind.COMPONENT,
-            'D:': Kind.DATA,
-            'I:': Kind.INTERFACE,
-            'M:': Kind.METHOD,
-            'UI:': Kind.UI,
-            'T:': Kind.TASK,
-            'TP:': Kind.TEST,
-        }
-
-        return kind_mapping.get(prefix, Kind.OTHER)
+        return self.KIND_BY_PREFIX.get(prefix, Kind.OTHER)
 
     def _create_anchor(self, title: str) -> str:
         """Create URL anchor from title text."""
         # Convert to lowercase, replace spaces with hyphens, keep only alphanumeric and hyphens
-        anchor = re.sub(r'[^\w\s-]', '', title.lower())
-        anchor = re.sub(r'\s+', '-', anchor)
-        anchor = re.sub(r'-+', '-', anchor)  # Collapse multiple hyphens
-        return anchor.strip('-')
+        anchor = self.ANCHOR_STRIP_PATTERN.sub('', title.lower())
+        # Runs of whitespace and hyphens become one hyphen, none at either end;
+        # str.split() uses the same Unicode whitespace definition as \s
+        return '-'.join(anchor.replace('-', ' ').split())
 
     def _extract_title_from_heading(self, heading_text: str) -> str:
         """Extract clean title from heading text, removing ID prefix if present."""
         # Remove leading # characters and whitespace
-        title = re.sub(r'^#+\s*', '', heading_text).strip()
+        title = self.HEADING_MARKER_PATTERN.sub('', heading_text).strip()
 
         # If title starts with ID: pattern, extract just the descriptive part
-        id_match = re.match(r'^([A-Za-z]+:\w+)\s*-\s*(.+)$', title)
+        id_match = self.ID_TITLE_PATTERN.match(title)
         if id_match:
             return id_match.group(2).strip()
 
@@ -110,6 +131,9 @@ class MarkdownParser:
         """
         Parse markdown content into DocElement objects.
 
+        Unchanged content is served from a cache of earlier parses; callers
+        always receive fresh DocElement copies they are free to modify.
+
         Args:
             markdown_content: Raw markdown file content.
 
@@ -119,6 +143,11 @@ class MarkdownParser:
         Raises:
             MarkdownParsingError: If parsing fails.
         """
+        cache_key = (self.file_enum, markdown_content)
+        cached_elements = _parse_cache.get(cache_key)
+        if cached_elements is not None:
+            return [_copy_element(element) for element in cached_elements]
+
         try:
             # Extract body ranges using existing body extraction
             body_ranges = extract_all_bodies(markdown_content)
@@ -134,12 +163,13 @@ class MarkdownParser:
                 # Reconstruct full heading for ID extraction
                 full_heading = '#' * heading_boundary.heading_level + ' ' + heading_boundary.heading_text
                 extracted_ids = extract_ids_from_markdown(full_heading)
-                element_id = extracted_ids[0].full_id if extracted_ids else None
+                # IDs are interned: each one recurs as a reference in many bodies
+                element_id = sys.intern(extracted_ids[0].full_id) if extracted_ids else None
 
                 # Extract references from body content
                 try:
                     references = detect_references(body_range.stripped_content or "")
-                    ref_ids = [ref.target_id for ref in references]
+                    ref_ids = [sys.intern(ref.target_id) for ref in references]
                 except ReferenceDetectionError:
                     ref_ids = []  # Continue parsing even if reference detection fails
 
@@ -166,6 +196,11 @@ class MarkdownParser:
                     print(f"Warning: Failed to create DocElement for '{parsed.title}': {e}")
                     continue
 
+            if PARSE_CACHE_LIMIT > 0:
+                if len(_parse_cache) >= PARSE_CACHE_LIMIT:
+                    _parse_cache.pop(next(iter(_parse_cache)), None)  # Evict the oldest entry
+                _parse_cache[cache_key] = [_copy_element(element) for element in doc_elements]
+
             return doc_elements
 
         except (BodyExtractionError, Exception) as e:
@@ -302,24 +337,17 @@ class MarkdownParser:
         if not elements:
             return {'total_elements': 0}
 
-        # Count by kind
-        kind_counts = {}
-        for element in elements:
-            kind_name = element.kind.value
-            kind_counts[kind_name] = kind_counts.get(kind_name, 0) + 1
-
-        # Count by heading level
-        level_counts = {}
-        for element in elements:
-            level = element.heading_level
-            level_counts[f"h{level}"] = level_counts.get(f"h{level}", 0) + 1
+        # Count by kind and by heading level
+        kind_counts = dict(Counter(element.kind.value for element in elements))
+        level_counts = {f"h{level}": count
+                        for level, count in Counter(element.heading_level for element in elements).items()}
 
         # Calculate total references
         total_refs = sum(len(element.refs) for element in elements)
         avg_refs = total_refs / len(elements) if elements else 0
 
         # Count elements with and without content
-        with_content = sum(1 for e in elements if e.body_markdown.strip())
+        with_content = sum(1 for e in elements if e.body_markdown and not e.body_markdown.isspace())
         without_content = len(elements) - with_content
 
         return {
@@ -6,15 +6,24 @@ specified in T:0006, finding both inline and explicit references to other elemen
 """
 
 import re
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import List, Set, Dict, Optional, Tuple
+from typing import List, Set, Dict, FrozenSet, Iterable, Iterator, Optional, Tuple
 from enum import Enum
 
 
-@dataclass
+# Reference type values shared by every Reference the detector creates
+INLINE_REFERENCE = "inline"
+EXPLICIT_REFERENCE = "explicit"
+
+
+@dataclass(slots=True, frozen=True)
 class Reference:
     """
     Represents a detected reference to another element.
+
+    Slotted and immutable: large documents produce many references, and a
+    detected reference is never edited after creation.
     """
     target_id: str               # ID being referenced (e.g., "C:WorkspaceManager")
     reference_type: str          # Type of reference ("inline", "explicit")
@@ -22,13 +31,25 @@ class Reference:
     line_number: int             # Line number where reference was found (0-based)
     position_in_line: int        # Character position in line (0-based)
 
-    def __post_init__(self):
-        """Validate reference data."""
-        if not self.target_id:
+    @classmethod
+    def validated(cls, target_id: str, reference_type: str, context: str,
+                  line_number: int, position_in_line: int) -> 'Reference':
+        """
+        Create a reference after validating its data.
+
+        The detector builds references directly from IDs it has already
+        validated; other callers should construct references through here.
+
+        Raises:
+            ValueError: If target_id is empty or reference_type is unknown.
+        """
+        if not target_id:
             raise ValueError("Reference target_id cannot be empty")
 
-        if self.reference_type not in ["inline", "explicit"]:
-            raise ValueError(f"Invalid reference type: {self.reference_type}")
+        if reference_type not in (INLINE_REFERENCE, EXPLICIT_REFERENCE):
+            raise ValueError(f"Invalid reference type: {reference_type}")
+
+        return cls(target_id, reference_type, context, line_number, position_in_line)
 
 
 class ReferenceDetectionError(Exception):
@@ -59,14 +80,21 @@ class ReferenceDetector:
         re.MULTILINE
     )
 
-    def __init__(self, known_ids: Optional[Set[str]] = None):
+    # Normalized (uppercase) ID prefixes accepted as references
+    VALID_PREFIXES = frozenset({"R:", "C:", "D:", "I:", "M:", "UI:", "T:", "TP:"})
+
+    # Characters of surrounding text kept on each side of an inline reference
+    CONTEXT_CHARS = 20
+
+    def __init__(self, known_ids: Optional[Iterable[str]] = None):
         """
         Initialize reference detector.
 
         Args:
-            known_ids: Set of valid IDs for validation (optional).
+            known_ids: Set of valid IDs for validation (optional). Copied into
+                a frozenset, so later changes to the caller's set are not seen.
         """
-        self.known_ids = known_ids or set()
+        self.known_ids: FrozenSet[str] = frozenset(known_ids or ())
 
     def _is_valid_id_suffix(self, suffix: str, prefix: str) -> bool:
         """Check if ID suffix is valid for the given prefix."""
@@ -84,8 +112,7 @@ class ReferenceDetector:
 
     def _is_valid_id(self, prefix: str, suffix: str) -> bool:
         """Check if the ID combination is valid."""
-        valid_prefixes = {"R:", "C:", "D:", "I:", "M:", "UI:", "T:", "TP:"}
-        return prefix in valid_prefixes and self._is_valid_id_suffix(suffix, prefix)
+        return prefix in self.VALID_PREFIXES and self._is_valid_id_suffix(suffix, prefix)
 
     def detect_references_in_text(self, body_text: str) -> List[Reference]:
         """
@@ -101,91 +128,190 @@ class ReferenceDetector:
             ReferenceDetectionError: If detection fails.
         """
         try:
+            # Every ID prefix ends with ':', so text without one holds no references
+            if ':' not in body_text:
+                return []
+
             references = []
 
             # Find explicit references first (they take priority)
-            explicit_refs = self._find_explicit_references(body_text)
+            explicit_refs, explicit_lines = self._find_explicit_references(body_text)
             references.extend(explicit_refs)
 
-            # Find inline references
-            inline_refs = self._find_inline_references(body_text)
+            # Find inline references, skipping list items already scanned as explicit
+            inline_refs = self._find_inline_references(body_text, explicit_lines)
             references.extend(inline_refs)
 
-            # Deduplicate references while preserving order (explicit refs win)
-            seen_ids = set()
-            unique_references = []
-
-            for ref in references:
-                if ref.target_id not in seen_ids:
-                    seen_ids.add(ref.target_id)
-                    unique_references.append(ref)
-
-            return unique_references
+            return self._deduplicate_references(references)
 
         except Exception as e:
             raise ReferenceDetectionError(f"Failed to detect references: {e}")
 
-    def _find_inline_references(self, body_text: str) -> List[Reference]:
-        """Find inline ID references within body text."""
-        references = []
-        lines = body_text.split('\n')
+    def detect_references_batch(self, texts: Iterable[str]) -> List[List[Reference]]:
+        """
+        Detect references in many body texts.
+
+        Equivalent to calling detect_references_in_text on each text in turn.
+        Joining the texts into one inline scan was measured slower, because
+        every reference then had to be remapped to its own text's line numbers.
+
+        Args:
+            texts: Body contents to scan for references.
+
+        Returns:
+            One list of detected references per input text, in input order.
+
+        Raises:
+            ReferenceDetectionError: If detection fails.
+        """
+        return [self.detect_references_in_text(text) for text in texts]
+
+    def _deduplicate_references(self, references: List[Reference]) -> List[Reference]:
+        """Drop repeated target IDs while preserving order (explicit refs come first and win)."""
+        seen_ids = set()
+        unique_references = []
+
+        for ref in references:
+            if ref.target_id not in seen_ids:
+                seen_ids.add(ref.target_id)
+                unique_references.append(ref)
+
+        return unique_references
+
+    def iter_references(self, line_iter: Iterable[str]) -> Iterator[Reference]:
+        """
+        Stream references from an iterable of lines without holding the whole text.
+
+        References are yielded in document order and are not deduplicated, so an
+        inline mention may appear before an explicit entry for the same ID. Use
+        detect_references_in_text when explicit-first, deduplicated results are
+        needed; this method suits statistics over very large documents.
+
+        Args:
+            line_iter: Lines of body text, with or without trailing newlines.
+
+        Yields:
+            Detected references, with 0-based line numbers.
+        """
+        in_ref_section = False
+
+        for line_num, line in enumerate(line_iter):
+            line = line.rstrip('\r\n')
+
+            if self.REFERENCES_SECTION_PATTERN.match(line):
+                in_ref_section = True
+                continue
+
+            if in_ref_section:
+                if line.strip().startswith('#'):
+                    in_ref_section = False
+                else:
+                    list_match = self.EXPLICIT_REF_PATTERN.match(line)
+                    if list_match:
+                        yield from self._explicit_references_in_item(
+                            line, line_num, list_match.group(1).strip()
+                        )
+                        continue
+
+            if ':' in line:
+                yield from self._inline_references_in_line(line, line_num)
+
+    def _find_inline_references(self, body_text: str,
+                                skip_lines: Optional[Set[int]] = None) -> List[Reference]:
+        """
+        Find inline ID references within body text.
+
+        Lines listed in skip_lines (explicit reference list items) are not rescanned.
+        """
+        references: List[Reference] = []
+        lines: List[str] = body_text.split('\n')
+        skip_lines = skip_lines or set()
 
         for line_num, line in enumerate(lines):
-            # Find all ID patterns in this line
-            for match in self.ID_PATTERN.finditer(line):
-                prefix, suffix = match.groups()
-                # Normalize prefix to uppercase for consistency
-                normalized_prefix = prefix.upper()
-
-                # Validate the ID format
-                if not self._is_valid_id(normalized_prefix, suffix):
-                    continue  # Skip invalid IDs
-
-                full_id = normalized_prefix + suffix
-
-                # Create context (surrounding text)
-                start_pos = max(0, match.start() - 20)
-                end_pos = min(len(line), match.end() + 20)
-                context = line[start_pos:end_pos].strip()
-
-                references.append(Reference(
-                    target_id=full_id,
-                    reference_type="inline",
-                    context=context,
-                    line_number=line_num,
-                    position_in_line=match.start()
-                ))
+            # Every ID prefix ends with ':'; lines without one cannot match
+            if ':' not in line or line_num in skip_lines:
+                continue
+
+            references.extend(self._inline_references_in_line(line, line_num))
 
         return references
 
-    def _find_explicit_references(self, body_text: str) -> List[Reference]:
-        """Find references in explicit 'References:' sections."""
-        references = []
+    def _inline_references_in_line(self, line: str, line_num: int) -> List[Reference]:
+        """Find inline ID references within a single line."""
+        references: List[Reference] = []
+        is_valid_id = self._is_valid_id
+        finditer = self.ID_PATTERN.finditer
+        context_chars: int = self.CONTEXT_CHARS
+
+        for match in finditer(line):
+            prefix, suffix = match.groups()
+            # Normalize prefix to uppercase for consistency
+            normalized_prefix = prefix.upper()
+
+            # Validate the ID format
+            if not is_valid_id(normalized_prefix, suffix):
+                continue  # Skip invalid IDs
+
+            full_id = normalized_prefix + suffix
+
+            # Create context (surrounding text); slicing already clamps the end
+            start_pos = max(match.start() - context_chars, 0)
+            context = line[start_pos:match.end() + context_chars].strip()
+
+            references.append(Reference(
+                target_id=full_id,
+                reference_type=INLINE_REFERENCE,
+                context=context,
+                line_number=line_num,
+                position_in_line=match.start()
+            ))
+
+        return references
+
+    def _find_explicit_references(self, body_text: str) -> Tuple[List[Reference], Set[int]]:
+        """
+        Find references in explicit 'References:' sections.
+
+        Returns:
+            Tuple of (references, line numbers of the list items that were scanned).
+        """
+        references: List[Reference] = []
+        scanned_lines: Set[int] = set()
+
+        # Most bodies have no "References:" section. It needs a heading marker and the
+        # word itself; both substring checks are far cheaper than the multiline scan.
+        if '#' not in body_text or 'reference' not in body_text.lower():
+            return references, scanned_lines
 
         # Find "References:" section headers
         ref_sections = list(self.REFERENCES_SECTION_PATTERN.finditer(body_text))
 
         if not ref_sections:
-            return references
+            return references, scanned_lines
 
         lines = body_text.split('\n')
 
         for section_match in ref_sections:
             # Find the line number of the "References:" header
             header_pos = section_match.start()
-            header_line_num = body_text[:header_pos].count('\n')
+            header_line_num = body_text.count('\n', 0, header_pos)
 
             # Scan lines after the header for list items
             section_references = self._parse_references_section(
-                lines, header_line_num + 1
+                lines, header_line_num + 1, scanned_lines
             )
             references.extend(section_references)
 
-        return references
+        return references, scanned_lines
+
+    def _parse_references_section(self, lines: List[str], start_line: int,
+                                  scanned_lines: Set[int]) -> List[Reference]:
+        """
+        Parse references from a References: section.
 
-    def _parse_references_section(self, lines: List[str], start_line: int) -> List[Reference]:
-        """Parse references from a References: section."""
-        references = []
+        Line numbers of parsed list items are added to scanned_lines.
+        """
+        references: List[Reference] = []
 
         for line_num in range(start_line, len(lines)):
             line = lines[line_num]
@@ -201,27 +327,36 @@ class ReferenceDetector:
             # Look for list items
             list_match = self.EXPLICIT_REF_PATTERN.match(line)
             if list_match:
-                list_content = list_match.group(1).strip()
+                scanned_lines.add(line_num)
+                references.extend(self._explicit_references_in_item(
+                    line, line_num, list_match.group(1).strip()
+                ))
+
+        return references
+
+    def _explicit_references_in_item(self, line: str, line_num: int,
+                                     list_content: str) -> List[Reference]:
+        """Extract IDs from the content of one References: list item."""
+        references: List[Reference] = []
 
-                # Extract IDs from list content
-                for id_match in self.ID_PATTERN.finditer(list_content):
-                    prefix, suffix = id_match.groups()
-                    # Normalize prefix to uppercase for consistency
-                    normalized_prefix = prefix.upper()
+        for id_match in self.ID_PATTERN.finditer(list_content):
+            prefix, suffix = id_match.groups()
+            # Normalize prefix to uppercase for consistency
+            normalized_prefix = prefix.upper()
 
-                    # Validate the ID format
-                    if not self._is_valid_id(normalized_prefix, suffix):
-                        continue  # Skip invalid IDs
+            # Validate the ID format
+            if not self._is_valid_id(normalized_prefix, suffix):
+                continue  # Skip invalid IDs
 
-                    full_id = normalized_prefix + suffix
+            full_id = normalized_prefix + suffix
 
-                    references.append(Reference(
-                        target_id=full_id,
-                        reference_type="explicit",
-                        context=list_content,
-                        line_number=line_num,
-                        position_in_line=id_match.start() + len(line) - len(line.lstrip())
-                    ))
+            references.append(Reference(
+                target_id=full_id,
+                reference_type=EXPLICIT_REFERENCE,
+                context=list_content,
+                line_number=line_num,
+                position_in_line=id_match.start() + len(line) - len(line.lstrip())
+            ))
 
         return references
 
@@ -237,12 +372,14 @@ class ReferenceDetector:
         """
         valid_ids = []
         invalid_ids = []
+        known_ids = self.known_ids
 
         for ref in references:
-            if ref.target_id in self.known_ids:
-                valid_ids.append(ref.target_id)
+            target_id = ref.target_id
+            if target_id in known_ids:
+                valid_ids.append(target_id)
             else:
-                invalid_ids.append(ref.target_id)
+                invalid_ids.append(target_id)
 
         return {
             'valid': valid_ids,
@@ -282,8 +419,8 @@ class ReferenceDetector:
         stats = {
             'total_references': len(references),
             'unique_targets': len(set(ref.target_id for ref in references)),
-            'inline_references': len([r for r in references if r.reference_type == "inline"]),
-            'explicit_references': len([r for r in references if r.reference_type == "explicit"])
+            'inline_references': sum(1 for r in references if r.reference_type == INLINE_REFERENCE),
+            'explicit_references': sum(1 for r in references if r.reference_type == EXPLICIT_REFERENCE)
         }
 
         # Count by prefix
@@ -309,12 +446,8 @@ class ReferenceDetector:
         if not self.known_ids:
             return []  # Can't validate without known IDs
 
-        broken_refs = []
-        for ref in references:
-            if ref.target_id not in self.known_ids:
-                broken_refs.append(ref)
-
-        return broken_refs
+        known_ids = self.known_ids
+        return [ref for ref in references if ref.target_id not in known_ids]
 
     def group_references_by_target(self, references: List[Reference]) -> Dict[str, List[Reference]]:
         """
@@ -326,14 +459,12 @@ class ReferenceDetector:
         Returns:
             Dict mapping target IDs to lists of references.
         """
-        grouped = {}
+        grouped = defaultdict(list)
 
         for ref in references:
-            if ref.target_id not in grouped:
-                grouped[ref.target_id] = []
             grouped[ref.target_id].append(ref)
 
-        return grouped
+        return dict(grouped)
 
     def find_reference_patterns(self, references: List[Reference]) -> Dict[str, List[str]]:
         """
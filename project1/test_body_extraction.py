@@ -412,6 +412,36 @@ More unicode: café, résumé, naïve.
     assert purpose_body.end_byte > purpose_body.start_byte
 
 
+def test_byte_positions_across_many_headings():
+    """Test byte offsets stay exact over many headings with mixed Unicode content."""
+    sections = []
+    for i in range(40):
+        body = f"Plain line {i}" if i % 2 else f"Ünïcödé line {i} 🎉"
+        sections.append(f"## C:Item{i}\n{body}\n")
+    markdown_text = "\n".join(sections)
+    text_bytes = markdown_text.encode('utf-8')
+
+    body_ranges = extract_all_bodies(markdown_text)
+    assert len(body_ranges) == 40
+
+    for heading, body_range in body_ranges:
+        body_text = text_bytes[body_range.start_byte:body_range.end_byte].decode('utf-8')
+        assert body_text.strip() == body_range.stripped_content
+        heading_line = text_bytes[heading.byte_position:].decode('utf-8').split('\n', 1)[0]
+        assert heading_line == f"## {heading.heading_text}"
+
+
+def test_heading_scan_line_edges():
+    """Test headings on the first and last lines, CRLF endings and non-headings."""
+    markdown_text = "# R:First\r\nbody\r\n####### Not a heading\n#\n # Indented\n## C:Last"
+
+    body_ranges = extract_all_bodies(markdown_text)
+    assert [h.line_number for h, _ in body_ranges] == [0, 5]
+    assert [h.heading_text for h, _ in body_ranges] == ["R:First", "C:Last"]
+    assert body_ranges[1][0].byte_position == len(markdown_text.encode('utf-8')) - len("## C:Last")
+    assert body_ranges[1][1].stripped_content == ""
+
+
 def test_element_summary():
     """Test element summary generation."""
     markdown_text = """# R:Purpose - System Purpose
@@ -517,6 +547,12 @@ if __name__ == "__main__":
     test_unicode_content()
     print("✓ Unicode handling")
 
+    test_byte_positions_across_many_headings()
+    print("✓ Byte positions across many headings")
+
+    test_heading_scan_line_edges()
+    print("✓ Heading scan line edges")
+
     test_element_summary()
     print("✓ Element summary")
 
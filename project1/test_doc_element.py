@@ -7,15 +7,26 @@ This validates T:0001 acceptance criteria.
 from doc_element import DocElement, Kind, File, Status
 
 
+# Shared field values; each test overrides only what it exercises
+BASE_ELEMENT_FIELDS = dict(
+    id="R:Purpose",
+    kind=Kind.REQUIREMENT,
+    title="System Purpose",
+    file=File.SOFTWARE_DESIGN,
+    heading_level=3,
+    anchor="r-purpose",
+    body_markdown="Some content...",
+)
+
+
+def create_test_element(**overrides) -> DocElement:
+    """Create a DocElement from the base test fields with the given overrides."""
+    return DocElement(**{**BASE_ELEMENT_FIELDS, **overrides})
+
+
 def test_create_valid_doc_element():
     """Test creating DocElement with all required fields."""
-    element = DocElement(
-        id="R:Purpose",
-        kind=Kind.REQUIREMENT,
-        title="System Purpose",
-        file=File.SOFTWARE_DESIGN,
-        heading_level=3,
-        anchor="r-purpose",
+    element = create_test_element(
         body_markdown="Project1 provides a disciplined workflow...",
         refs=["C:WorkspaceManager", "D:DocElement"],
         backlinks=["T:0001"]
@@ -35,12 +46,11 @@ def test_create_valid_doc_element():
 
 def test_task_element_with_status():
     """Test creating Task element with default status."""
-    task = DocElement(
+    task = create_test_element(
         id="T:0001",
         kind=Kind.TASK,
         title="Define DocElement data structure",
         file=File.DEVELOPMENT_PLAN,
-        heading_level=3,
         anchor="t-0001",
         body_markdown="Implement the core DocElement struct/class...",
     )
@@ -50,49 +60,29 @@ def test_task_element_with_status():
     assert task.is_task() is True
 
 
-def test_non_task_with_status_fails():
-    """Test that non-Task elements cannot have status."""
-    try:
-        DocElement(
-            id="R:Purpose",
-            kind=Kind.REQUIREMENT,
-            title="System Purpose",
-            file=File.SOFTWARE_DESIGN,
-            heading_level=3,
-            anchor="r-purpose",
-            body_markdown="Some content...",
-            status=Status.PENDING  # Invalid for non-Task
-        )
-        assert False, "Should have raised ValueError"
-    except ValueError as e:
-        assert "Status field only valid for Task kind" in str(e)
-
-
-def test_empty_id_fails():
-    """Test that empty ID raises validation error."""
-    try:
-        DocElement(
-            id="",  # Invalid empty ID
-            kind=Kind.REQUIREMENT,
-            title="System Purpose",
-            file=File.SOFTWARE_DESIGN,
-            heading_level=3,
-            anchor="r-purpose",
-            body_markdown="Some content..."
-        )
-        assert False, "Should have raised ValueError"
-    except ValueError as e:
-        assert "DocElement id cannot be empty" in str(e)
+# Field overrides that must be rejected, with the expected error message
+INVALID_ELEMENT_CASES = [
+    (dict(status=Status.PENDING), "Status field only valid for Task kind"),  # Status on non-Task
+    (dict(id=""), "DocElement id cannot be empty"),
+]
+
+
+def test_invalid_elements_fail():
+    """Test that invalid field combinations raise validation errors."""
+    for overrides, expected_message in INVALID_ELEMENT_CASES:
+        try:
+            create_test_element(**overrides)
+            assert False, f"Should have raised ValueError for {overrides}"
+        except ValueError as e:
+            assert expected_message in str(e)
 
 
 def test_serialization_roundtrip():
     """Test JSON serialization and deserialization."""
-    original = DocElement(
+    original = create_test_element(
         id="C:WorkspaceManager",
         kind=Kind.COMPONENT,
         title="Workspace Manager",
-        file=File.SOFTWARE_DESIGN,
-        heading_level=3,
         anchor="c-workspacemanager",
         body_markdown="Purpose: Load, validate, and index...",
         refs=["R:WorkspaceLayout"],
@@ -117,12 +107,11 @@ def test_serialization_roundtrip():
 
 def test_task_serialization_with_status():
     """Test Task element serialization preserves status."""
-    task = DocElement(
+    task = create_test_element(
         id="T:0001",
         kind=Kind.TASK,
         title="Define DocElement",
         file=File.DEVELOPMENT_PLAN,
-        heading_level=3,
         anchor="t-0001",
         body_markdown="Implementation details...",
         status=Status.IN_PROGRESS
@@ -135,14 +124,24 @@ def test_task_serialization_with_status():
     assert restored.is_task() is True
 
 
+def test_deserialization_rejects_unknown_enum_values():
+    """Test that unknown enum values in serialized data raise ValueError."""
+    for key, bad_value in [('kind', 'Widget'), ('file', 'readme'), ('status', 'blocked')]:
+        data = create_test_element(id="T:0001", kind=Kind.TASK).to_dict()
+        data[key] = bad_value
+        try:
+            DocElement.from_dict(data)
+            assert False, f"Should have raised ValueError for {key}={bad_value!r}"
+        except ValueError as e:
+            assert bad_value in str(e)
+
+
 def test_reference_management():
     """Test adding references and backlinks."""
-    element = DocElement(
+    element = create_test_element(
         id="C:Parser",
         kind=Kind.COMPONENT,
         title="Markdown Parser",
-        file=File.SOFTWARE_DESIGN,
-        heading_level=3,
         anchor="c-parser",
         body_markdown="Parses markdown files..."
     )
@@ -161,16 +160,50 @@ def test_reference_management():
 
     assert element.backlinks == ["T:0004", "T:0007"]
 
+    # References supplied at construction also count as already present
+    seeded = create_test_element(refs=["D:DocElement"], backlinks=["T:0004"])
+    seeded.add_reference("D:DocElement")
+    seeded.add_backlink("T:0004")
+    assert seeded.refs == ["D:DocElement"]
+    assert seeded.backlinks == ["T:0004"]
+    assert seeded == create_test_element(refs=["D:DocElement"], backlinks=["T:0004"])
+
+
+def test_reference_lists_changed_directly():
+    """Test duplicate checks follow refs/backlinks reassigned or cleared directly."""
+    element = create_test_element()
+    element.add_reference("D:DocElement")
+    element.add_backlink("T:0004")
+
+    # Reassigned lists: entries already present are still not duplicated
+    element.refs = ["C:Indexer"]
+    element.backlinks = ["T:0007"]
+    element.add_reference("C:Indexer")
+    element.add_backlink("T:0007")
+    assert element.refs == ["C:Indexer"]
+    assert element.backlinks == ["T:0007"]
+
+    # Cleared lists: previously seen entries can be added again
+    element.refs.clear()
+    element.backlinks.clear()
+    element.add_reference("C:Indexer")
+    element.add_backlink("T:0007")
+    assert element.refs == ["C:Indexer"]
+    assert element.backlinks == ["T:0007"]
+
+    # Lists grown directly are also respected
+    element.refs.append("D:DocElement")
+    element.add_reference("D:DocElement")
+    assert element.refs == ["C:Indexer", "D:DocElement"]
+
 
 def test_enum_validation():
     """Test enum fields accept only valid values."""
     # Valid enums should work
-    element = DocElement(
+    element = create_test_element(
         id="UI:MainWindow",
         kind=Kind.UI,
         title="Main Application Window",
-        file=File.SOFTWARE_DESIGN,
-        heading_level=3,
         anchor="ui-mainwindow",
         body_markdown="Main window layout..."
     )
@@ -188,11 +221,8 @@ if __name__ == "__main__":
     test_task_element_with_status()
     print("✓ Task element with status")
 
-    test_non_task_with_status_fails()
-    print("✓ Non-task status validation")
-
-    test_empty_id_fails()
-    print("✓ Empty ID validation")
+    test_invalid_elements_fail()
+    print("✓ Invalid element validation")
 
     test_serialization_roundtrip()
     print("✓ JSON serialization roundtrip")
@@ -200,9 +230,15 @@ if __name__ == "__main__":
     test_task_serialization_with_status()
     print("✓ Task status serialization")
 
+    test_deserialization_rejects_unknown_enum_values()
+    print("✓ Unknown enum value rejection")
+
     test_reference_management()
     print("✓ Reference management")
 
+    test_reference_lists_changed_directly()
+    print("✓ Reference lists changed directly")
+
     test_enum_validation()
     print("✓ Enum validation")
 
@@ -5,28 +5,113 @@ This validates T:0009 acceptance criteria.
 """
 
 import os
+import selectors
+import sys
 import time
 import tempfile
+import weakref
+from collections import deque
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from threading import Event
 from file_watching import (
     FileSystemEvent, FileEventType, PollingFileWatcher, WorkspaceFileWatcher,
-    FileWatcherError, create_file_watcher
+    FileWatcherError, create_file_watcher, WATCHDOG_AVAILABLE, INOTIFY_AVAILABLE,
+    MSGPACK_AVAILABLE, _has_markdown_suffix
 )
 
+if INOTIFY_AVAILABLE:
+    from file_watching import InotifyFileWatcher
+
+# On Linux, keep test trees on tmpfs so writes never wait on a disk flush
+# and the short poll windows below stay predictable.
+TEST_TEMP_ROOT = '/dev/shm' if sys.platform == 'linux' and os.access('/dev/shm', os.W_OK) else None
+
+# Event-driven workspace tests run against every backend available here:
+# polling always, plus watchdog's native inotify/FSEvents observer when installed.
+WATCHER_BACKENDS = [False, True] if WATCHDOG_AVAILABLE else [False]
+
+# Backend WorkspaceFileWatcher picks when watchdog is not requested
+FALLBACK_WATCHER_TYPE = "inotify" if INOTIFY_AVAILABLE else "polling"
+
+
+def settle_mtime(path: Path) -> None:
+    """Age a path's mtime past the settle window so its recorded state can be reused."""
+    settled_ns = time.time_ns() - 10 * 1_000_000_000
+    os.utime(path, ns=(settled_ns, settled_ns))
+
+
+def create_workspace_watcher(use_watchdog: bool) -> WorkspaceFileWatcher:
+    """Create a workspace watcher with a short poll interval for tests."""
+    watcher = WorkspaceFileWatcher(use_watchdog=use_watchdog)
+    if hasattr(watcher.watcher, 'poll_interval'):
+        watcher.watcher.poll_interval = 0.05
+    return watcher
+
+
+class EventFdSignal:
+    """
+    threading.Event replacement backed by a Linux eventfd.
+
+    The watcher thread signals with a single write and the waiting test thread
+    sleeps in the selector, which wakes faster than Event's condition variable.
+    """
+
+    def __init__(self):
+        self._fd = os.eventfd(0, os.EFD_NONBLOCK)
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._fd, selectors.EVENT_READ)
+        # Close the descriptors when the signal is garbage collected
+        weakref.finalize(self, EventFdSignal._close, self._selector, self._fd)
+
+    @staticmethod
+    def _close(selector: selectors.BaseSelector, fd: int) -> None:
+        selector.close()
+        os.close(fd)
+
+    def set(self) -> None:
+        """Signal any waiter."""
+        os.eventfd_write(self._fd, 1)
+
+    def wait(self, timeout: float) -> bool:
+        """Wait until signalled; the signal stays set until clear()."""
+        return bool(self._selector.select(timeout))
+
+    def clear(self) -> None:
+        """Reset the signal."""
+        try:
+            os.eventfd_read(self._fd)
+        except BlockingIOError:
+            pass  # Was not set
+
+
+def create_signal():
+    """Create an eventfd-backed signal on Linux, otherwise a threading.Event."""
+    return EventFdSignal() if hasattr(os, 'eventfd') else Event()
+
 
 class EventCollector:
     """Helper class to collect file system events for testing."""
 
+    # Bounded so a watcher left running cannot grow the collector without limit
+    MAX_EVENTS = 1024
+
     def __init__(self):
-        self.events = []
-        self.event_received = Event()
+        self.events = deque(maxlen=self.MAX_EVENTS)
+        self.batches = []
+        self.event_received = create_signal()
 
     def handle_event(self, event: FileSystemEvent) -> None:
         """Handle file system event."""
         self.events.append(event)
         self.event_received.set()
 
+    def handle_batch(self, events) -> None:
+        """Handle a batch of file system events delivered in one poll."""
+        self.batches.append(list(events))
+        self.events.extend(events)
+        self.event_received.set()
+
     def handle_change(self, file_path: Path, event_type: FileEventType) -> None:
         """Handle workspace file change."""
         event = FileSystemEvent(
@@ -44,9 +129,24 @@ class EventCollector:
         self.event_received.clear()
         return result
 
+    def wait_for_events(self, count: int, timeout: float = 5.0) -> bool:
+        """Wait until at least `count` events have been collected."""
+        return self.wait_until(lambda events: len(events) >= count, timeout)
+
+    def wait_until(self, predicate, timeout: float = 5.0) -> bool:
+        """Wait until predicate(events) holds for the collected events."""
+        deadline = time.monotonic() + timeout
+        while not predicate(self.events):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self.event_received.wait(remaining):
+                return False
+            self.event_received.clear()
+        return True
+
     def clear_events(self) -> None:
         """Clear collected events."""
         self.events.clear()
+        self.batches.clear()
         self.event_received.clear()
 
 
@@ -88,6 +188,47 @@ def test_file_system_event_move():
     assert str(src_path) in str(event) and str(dest_path) in str(event)
 
 
+def test_file_system_event_msgpack_roundtrip():
+    """Test binary serialization of FileSystemEvent."""
+    events = [
+        FileSystemEvent(
+            event_type=FileEventType.MODIFIED,
+            file_path=Path("/test/file.md"),
+            is_directory=False,
+            timestamp=time.time(),
+            size_bytes=1024,
+            checksum="abc123"
+        ),
+        FileSystemEvent(
+            event_type=FileEventType.MOVED,
+            file_path=Path("/test/new.md"),
+            is_directory=False,
+            timestamp=time.time(),
+            src_path=Path("/test/old.md")
+        ),
+    ]
+
+    for event in events:
+        if not MSGPACK_AVAILABLE:
+            try:
+                event.to_msgpack()
+                assert False, "Should have raised FileWatcherError"
+            except FileWatcherError:
+                pass
+            continue
+
+        assert FileSystemEvent.from_msgpack(event.to_msgpack()) == event
+
+
+def test_markdown_suffix_detection():
+    """Test markdown suffix detection on paths and file names."""
+    assert _has_markdown_suffix("design.md")
+    assert _has_markdown_suffix("/workspace/project/README.MD")
+    assert not _has_markdown_suffix("notes.txt")
+    assert not _has_markdown_suffix("archive.md.bak")
+    assert not _has_markdown_suffix("md")
+
+
 def test_polling_file_watcher_initialization():
     """Test PollingFileWatcher initialization."""
     watcher = PollingFileWatcher(poll_interval=0.5)
@@ -117,7 +258,7 @@ def test_polling_file_watcher_event_handlers():
 
 def test_file_checksum_calculation():
     """Test file checksum calculation for change detection."""
-    with tempfile.TemporaryDirectory() as temp_dir:
+    with tempfile.TemporaryDirectory(dir=TEST_TEMP_ROOT) as temp_dir:
         temp_path = Path(temp_dir)
         test_file = temp_path / "test.md"
 
@@ -131,7 +272,7 @@ def test_file_checksum_calculation():
         test_file.write_text("# Test Content\n\nSome content here.")
         checksum1 = watcher._calculate_file_checksum(test_file)
         assert checksum1 is not None
-        assert len(checksum1) == 32  # MD5 hex digest
+        assert len(checksum1) == 32  # 128-bit hex digest
 
         # Test same content produces same checksum
         checksum2 = watcher._calculate_file_checksum(test_file)
@@ -143,11 +284,304 @@ def test_file_checksum_calculation():
         assert checksum3 != checksum1
 
 
+def test_unchanged_file_reuses_checksum():
+    """Test that scans only hash files when a same-size change needs comparing."""
+    with tempfile.TemporaryDirectory(dir=TEST_TEMP_ROOT) as temp_dir:
+        temp_path = Path(temp_dir)
+        test_file = temp_path / "test.md"
+        test_file.write_text("# Test Content\n")
+        settle_mtime(test_file)
+
+        watcher = PollingFileWatcher()
+
+        hashed_files = []
+        original_checksum = watcher._calculate_file_checksum
+
+        def counting_checksum(file_path: Path):
+            hashed_files.append(file_path)
+            return original_checksum(file_path)
+
+        watcher._calculate_file_checksum = counting_checksum
+
+        # First scan: new file is hashed
+        events = watcher._collect_changes(temp_path)
+        assert [e.event_type for e in events] == [FileEventType.CREATED]
+        first_checksum = watcher.file_states[test_file]['checksum']
+        assert hashed_files == [test_file]
+
+        # Same stat: nothing is re-hashed or reported
+        assert watcher._collect_changes(temp_path) == []
+        assert watcher.file_states[test_file]['checksum'] == first_checksum
+        assert hashed_files == [test_file]
+
+        # Changed size: reported as modified without reading the file
+        test_file.write_text("# Test Content\n\nMore content.")
+        settle_mtime(test_file)
+        events = watcher._collect_changes(temp_path)
+        assert [e.event_type for e in events] == [FileEventType.MODIFIED]
+        assert events[0].checksum is None
+        assert watcher.file_states[test_file]['checksum'] is None
+        assert hashed_files == [test_file]
+
+        # Same size, new mtime: hashed, and reported since there is no hash to compare
+        stat = test_file.stat()
+        test_file.write_text("# Test Content\n\nMore CONTENT.")
+        os.utime(test_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        events = watcher._collect_changes(temp_path)
+        assert [e.event_type for e in events] == [FileEventType.MODIFIED]
+        assert watcher.file_states[test_file]['checksum'] not in (None, first_checksum)
+        assert hashed_files == [test_file, test_file]
+
+
+def test_stat_fast_path_checks_inode_and_content():
+    """Test that atomic replacements are detected and content-free touches are not."""
+    with tempfile.TemporaryDirectory(dir=TEST_TEMP_ROOT) as temp_dir:
+        temp_path = Path(temp_dir)
+        test_file = temp_path / "test.md"
+        test_file.write_text("# Version A\n")
+        settle_mtime(test_file)
+
+        watcher = PollingFileWatcher()
+        watcher._collect_changes(temp_path)
+        original_stat = test_file.stat()
+
+        # Touch without editing: stat changes, content does not
+        os.utime(test_file, ns=(original_stat.st_atime_ns, original_stat.st_mtime_ns + 1_000_000))
+        assert watcher._collect_changes(temp_path) == []
+        assert watcher.file_states[test_file]['mtime_ns'] == original_stat.st_mtime_ns + 1_000_000
+
+        # Save by rename with the same size and mtime: only the inode differs
+        touched_stat = test_file.stat()
+        replacement = temp_path / "test.md.tmp"
+        replacement.write_text("# Version B\n")
+        os.utime(replacement, ns=(touched_stat.st_atime_ns, touched_stat.st_mtime_ns))
+        os.replace(replacement, test_file)
+        assert test_file.stat().st_ino != touched_stat.st_ino
+
+        events = watcher._collect_changes(temp_path)
+        assert [e.event_type for e in events] == [FileEventType.MODIFIED]
+
+
+def test_recent_file_is_rehashed_despite_unchanged_stat():
+    """Test that a same-size rewrite within the file's mtime tick is still reported."""
+    with tempfile.TemporaryDirectory(dir=TEST_TEMP_ROOT) as temp_dir:
+        temp_path = Path(temp_dir)
+        test_file = temp_path / "test.md"
+        test_file.write_text("# T:0001\n")
+
+        watcher = PollingFileWatcher()
+        watcher._collect_changes(temp_path)
+        recorded_stat = test_file.stat()
+        assert not watcher.file_states[test_file]['settled']
+
+        # Same-size rewrite stamped with the same mtime, as a coarse clock would
+        test_file.write_text("# T:0002\n")
+        os.utime(test_file, ns=(recorded_stat.st_atime_ns, recorded_stat.st_mtime_ns))
+        assert watcher._stat_unchanged(test_file.stat(), {**watcher.file_states[test_file], 'settled': True})
+
+        events = watcher._collect_changes(temp_path)
+        assert [e.event_type for e in events] == [FileEventType.MODIFIED]
+
+        # Once settled, the recorded checksum is reused again
+        settle_mtime(test_file)
+        watcher._collect_changes(temp_path)
+        assert watcher.file_states[test_file]['settled']
+        watcher._calculate_file_checksum = lambda file_path: None
+        assert watcher._collect_changes(temp_path) == []
+
+
+def test_saved_state_skips_rehash_on_restart():
+    """Test that a watcher restarted from a state snapshot only hashes changed files."""
+    with tempfile.TemporaryDirectory(dir=TEST_TEMP_ROOT) as temp_dir:
+        temp_path = Path(temp_dir)
+        watch_path = temp_path / "project"
+        watch_path.mkdir()
+        snapshot_path = temp_path / "cache" / "watcher_state.msgpack"
+        for name in ("kept.md", "edited.md", "removed.md"):
+            (watch_path / name).write_text(f"# {name}\n")
+            settle_mtime(watch_path / name)
+
+        first_watcher = PollingFileWatcher(poll_interval=60.0)
+        if not MSGPACK_AVAILABLE:
+            try:
+                first_watcher.save_state(str(snapshot_path))
+                assert False, "Should have raised FileWatcherError"
+            except FileWatcherError:
+                pass
+            return
+
+        first_watcher.start_watching(str(watch_path))
+        first_watcher.save_state(str(snapshot_path))
+        first_watcher.stop_watching()
+
+        # Changes made while no watcher is running
+        (watch_path / "edited.md").write_text("# edited.md, now longer\n")
+        settle_mtime(watch_path / "edited.md")
+        (watch_path / "removed.md").unlink()
+
+        second_watcher = PollingFileWatcher(poll_interval=60.0)
+        hashed_files = []
+        original_checksum = second_watcher._calculate_file_checksum
+
+        def counting_checksum(file_path: Path):
+            hashed_files.append(file_path.name)
+            return original_checksum(file_path)
+
+        second_watcher._calculate_file_checksum = counting_checksum
+        second_watcher.load_state(str(snapshot_path))
+        try:
+            second_watcher.start_watching(str(watch_path))
+            assert hashed_files == []  # kept.md reused its checksum; edited.md changed size
+            assert sorted(p.name for p in second_watcher.file_states) == ["edited.md", "kept.md"]
+        finally:
+            second_watcher.stop_watching()
+
+        # Snapshots that are not watcher state are rejected
+        snapshot_path.write_bytes(b"not msgpack state")
+        try:
+            second_watcher.load_state(str(snapshot_path))
+            assert False, "Should have raised FileWatcherError"
+        except FileWatcherError:
+            pass
+
+
+def test_scan_events_share_timestamp():
+    """Test that events from one scan carry the same wall-clock timestamp."""
+    with tempfile.TemporaryDirectory(dir=TEST_TEMP_ROOT) as temp_dir:
+        temp_path = Path(temp_dir)
+        (temp_path / "first.md").write_text("# First\n")
+        (temp_path / "second.md").write_text("# Second\n")
+
+        watcher = PollingFileWatcher()
+        before = time.time()
+        events = watcher._collect_changes(temp_path)
+        after = time.time()
+
+        assert len(events) == 2
+        assert events[0].timestamp == events[1].timestamp
+        assert before <= events[0].timestamp <= after
+
+
+def test_unreadable_directory_is_skipped():
+    """Test that a directory that cannot be listed does not abort the scan."""
+    with tempfile.TemporaryDirectory(dir=TEST_TEMP_ROOT) as temp_dir:
+        temp_path = Path(temp_dir)
+        locked_path = temp_path / "a_locked"
+        other_path = temp_path / "b_other"
+        locked_path.mkdir()
+        other_path.mkdir()
+        (temp_path / "top.md").write_text("# Top\n")
+        (locked_path / "hidden.md").write_text("# Hidden\n")
+        (other_path / "visible.md").write_text("# Visible\n")
+
+        # Running as root ignores permission bits, so simulate the denial
+        original_scandir = os.scandir
+
+        def denying_scandir(path):
+            if Path(path) == locked_path:
+                raise PermissionError(f"Permission denied: {path}")
+            return original_scandir(path)
+
+        watcher = PollingFileWatcher()
+        os.scandir = denying_scandir
+        try:
+            names = {Path(path).name for path, _ in watcher._iter_markdown_files(temp_path)}
+        finally:
+            os.scandir = original_scandir
+
+        assert names == {"top.md", "visible.md"}
+
+
+def test_unchanged_directories_are_not_relisted():
+    """Test that directories with a settled, unchanged mtime reuse their previous listing."""
+    with tempfile.TemporaryDirectory(dir=TEST_TEMP_ROOT) as temp_dir:
+        temp_path = Path(temp_dir)
+        docs_path = temp_path / "docs"
+        docs_path.mkdir()
+        (temp_path / "top.md").write_text("# Top\n")
+        (docs_path / "guide.md").write_text("# Guide\n")
+
+        # Age the directories past the settle window
+        settled_ns = time.time_ns() - 10 * 1_000_000_000
+        for dir_path in (temp_path, docs_path):
+            os.utime(dir_path, ns=(settled_ns, settled_ns))
+
+        listed = []
+        original_scandir = os.scandir
+
+        def recording_scandir(path):
+            listed.append(Path(path))
+            return original_scandir(path)
+
+        watcher = PollingFileWatcher()
+        os.scandir = recording_scandir
+        try:
+            watcher._collect_changes(temp_path)
+            assert sorted(listed) == [temp_path, docs_path]
+
+            # Nothing added or removed: no directory is listed again
+            listed.clear()
+            assert watcher._collect_changes(temp_path) == []
+            assert listed == []
+
+            # Content edits are still seen through the known files' stat
+            (docs_path / "guide.md").write_text("# Guide\n\nMore.")
+            os.utime(docs_path, ns=(settled_ns, settled_ns))
+            events = watcher._collect_changes(temp_path)
+            assert [(e.event_type, e.file_path.name) for e in events] == [(FileEventType.MODIFIED, "guide.md")]
+            assert listed == []
+
+            # A new entry changes the directory's mtime, so only that directory is re-listed
+            (docs_path / "new.md").write_text("# New\n")
+            events = watcher._collect_changes(temp_path)
+            assert [(e.event_type, e.file_path.name) for e in events] == [(FileEventType.CREATED, "new.md")]
+            assert listed == [docs_path]
+
+            # A fresh mtime is not trusted yet, so the directory keeps being re-listed
+            listed.clear()
+            watcher._collect_changes(temp_path)
+            assert listed == [docs_path]
+        finally:
+            os.scandir = original_scandir
+
+
+def test_parallel_file_states_match_serial():
+    """Test that pooled file state calculation matches computing states one by one."""
+    with tempfile.TemporaryDirectory(dir=TEST_TEMP_ROOT) as temp_dir:
+        temp_path = Path(temp_dir)
+        changed_files = []
+        for i in range(8):
+            test_file = temp_path / f"doc{i}.md"
+            test_file.write_text(f"# Document {i}\n" * (i + 1))
+            changed_files.append((test_file, None))
+
+        watcher = PollingFileWatcher(poll_interval=0.05)
+        serial_states = watcher._get_file_states(changed_files)
+        assert serial_states == [watcher._get_file_state(f) for f, _ in changed_files]
+
+        try:
+            watcher.start_watching(str(temp_path))
+            if (os.cpu_count() or 1) > 1:
+                assert watcher._hash_executor is not None
+            assert watcher._get_file_states(changed_files) == serial_states
+        finally:
+            watcher.stop_watching()
+
+        assert watcher._hash_executor is None
+
+        # Exercise the pooled path regardless of the CPU count here
+        watcher._hash_executor = ThreadPoolExecutor(max_workers=4)
+        try:
+            assert watcher._get_file_states(changed_files) == serial_states
+        finally:
+            watcher._hash_executor.shutdown()
+
+
 def test_polling_file_watcher_file_creation():
     """Test detection of file creation events."""
-    with tempfile.TemporaryDirectory() as temp_dir:
+    with tempfile.TemporaryDirectory(dir=TEST_TEMP_ROOT) as temp_dir:
         temp_path = Path(temp_dir)
-        watcher = PollingFileWatcher(poll_interval=0.1)
+        watcher = PollingFileWatcher(poll_interval=0.05)
         collector = EventCollector()
 
         watcher.add_event_handler(collector.handle_event)
@@ -157,10 +591,6 @@ def test_polling_file_watcher_file_creation():
             watcher.start_watching(str(temp_path))
             assert watcher.is_watching()
 
-            # Wait a bit for initial scan
-            time.sleep(0.2)
-            collector.clear_events()
-
             # Create a markdown file
             test_file = temp_path / "new_file.md"
             test_file.write_text("# New File\n\nContent here.")
@@ -184,25 +614,22 @@ def test_polling_file_watcher_file_creation():
 
 def test_polling_file_watcher_file_modification():
     """Test detection of file modification events."""
-    with tempfile.TemporaryDirectory() as temp_dir:
+    with tempfile.TemporaryDirectory(dir=TEST_TEMP_ROOT) as temp_dir:
         temp_path = Path(temp_dir)
         test_file = temp_path / "existing.md"
 
         # Create initial file
         test_file.write_text("# Original Content\n")
 
-        watcher = PollingFileWatcher(poll_interval=0.1)
+        watcher = PollingFileWatcher(poll_interval=0.05)
         collector = EventCollector()
 
         watcher.add_event_handler(collector.handle_event)
 
         try:
-            # Start watching (initial scan will detect existing file)
+            # Start watching (the baseline scan records the existing file silently)
             watcher.start_watching(str(temp_path))
-
-            # Wait for initial scan
-            time.sleep(0.2)
-            collector.clear_events()
+            assert len(collector.events) == 0
 
             # Modify the file
             test_file.write_text("# Modified Content\n\nNew content added.")
@@ -224,25 +651,22 @@ def test_polling_file_watcher_file_modification():
 
 def test_polling_file_watcher_file_deletion():
     """Test detection of file deletion events."""
-    with tempfile.TemporaryDirectory() as temp_dir:
+    with tempfile.TemporaryDirectory(dir=TEST_TEMP_ROOT) as temp_dir:
         temp_path = Path(temp_dir)
         test_file = temp_path / "to_delete.md"
 
         # Create initial file
         test_file.write_text("# File to Delete\n")
 
-        watcher = PollingFileWatcher(poll_interval=0.1)
+        watcher = PollingFileWatcher(poll_interval=0.05)
         collector = EventCollector()
 
         watcher.add_event_handler(collector.handle_event)
 
         try:
-            # Start watching (initial scan will detect existing file)
+            # Start watching (the baseline scan records the existing file silently)
             watcher.start_watching(str(temp_path))
-
-            # Wait for initial scan
-            time.sleep(0.2)
-            collector.clear_events()
+            assert len(collector.events) == 0
 
             # Delete the file
             test_file.unlink()
@@ -264,9 +688,9 @@ def test_polling_file_watcher_file_deletion():
 
 def test_polling_file_watcher_non_markdown_files():
     """Test that non-markdown files are ignored."""
-    with tempfile.TemporaryDirectory() as temp_dir:
+    with tempfile.TemporaryDirectory(dir=TEST_TEMP_ROOT) as temp_dir:
         temp_path = Path(temp_dir)
-        watcher = PollingFileWatcher(poll_interval=0.1)
+        watcher = PollingFileWatcher(poll_interval=0.05)
         collector = EventCollector()
 
         watcher.add_event_handler(collector.handle_event)
@@ -275,10 +699,6 @@ def test_polling_file_watcher_non_markdown_files():
             # Start watching
             watcher.start_watching(str(temp_path))
 
-            # Wait for initial scan
-            time.sleep(0.2)
-            collector.clear_events()
-
             # Create non-markdown files
             (temp_path / "test.txt").write_text("Text file")
             (temp_path / "config.json").write_text('{"key": "value"}')
@@ -287,8 +707,8 @@ def test_polling_file_watcher_non_markdown_files():
             # Create a markdown file
             (temp_path / "document.md").write_text("# Document\n")
 
-            # Wait for events
-            time.sleep(0.5)
+            # Any scan that sees the markdown file has also seen the earlier noise files
+            assert collector.wait_for_event(timeout=2.0), "Should have detected markdown file"
 
             # Should only detect the markdown file
             creation_events = [e for e in collector.events if e.event_type == FileEventType.CREATED]
@@ -299,6 +719,80 @@ def test_polling_file_watcher_non_markdown_files():
             watcher.stop_watching()
 
 
+def test_polling_file_watcher_batch_handlers():
+    """Test that batch handlers receive all events from one scan in a single call."""
+    with tempfile.TemporaryDirectory(dir=TEST_TEMP_ROOT) as temp_dir:
+        temp_path = Path(temp_dir)
+        watcher = PollingFileWatcher(poll_interval=0.05)
+        batch_collector = EventCollector()
+        event_collector = EventCollector()
+
+        watcher.add_batch_handler(batch_collector.handle_batch)
+        watcher.add_batch_handler(batch_collector.handle_batch)  # Duplicate ignored
+        watcher.add_event_handler(event_collector.handle_event)
+        assert len(watcher.batch_handlers) == 1
+
+        for name in ("one.md", "two.md", "three.md"):
+            (temp_path / name).write_text(f"# {name}\n")
+        (temp_path / "notes.txt").write_text("Not markdown")
+
+        # Drive a single scan directly so all files land in the same batch
+        watcher._scan_directory(temp_path)
+
+        assert len(batch_collector.batches) == 1
+        assert {e.file_path.name for e in batch_collector.batches[0]} == {"one.md", "two.md", "three.md"}
+
+        # Per-event handlers still see every event individually
+        assert len(event_collector.events) == 3
+
+        # Empty scans do not invoke batch handlers
+        watcher._scan_directory(temp_path)
+        assert len(batch_collector.batches) == 1
+
+        watcher.remove_batch_handler(batch_collector.handle_batch)
+        assert len(watcher.batch_handlers) == 0
+
+
+def test_polling_file_watcher_batch_spans_watch_paths():
+    """Test that one poll delivers changes from every watched path in one batch."""
+    with tempfile.TemporaryDirectory(dir=TEST_TEMP_ROOT) as temp_dir:
+        temp_path = Path(temp_dir)
+        first_path = temp_path / "first"
+        second_path = temp_path / "second"
+        first_path.mkdir()
+        second_path.mkdir()
+
+        # Existing file must stay out of every batch: not created, not deleted
+        (first_path / "existing.md").write_text("# Existing\n")
+
+        watcher = PollingFileWatcher(poll_interval=0.05)
+        collector = EventCollector()
+        watcher.add_batch_handler(collector.handle_batch)
+
+        try:
+            watcher.start_watching(str(first_path))
+            watcher.start_watching(str(second_path))
+            assert collector.batches == []
+
+            # Holding the scan lock keeps the poll thread from scanning between the writes
+            with watcher._scan_lock:
+                (first_path / "design1.md").write_text("# Design 1")
+                (second_path / "design2.md").write_text("# Design 2")
+
+            assert collector.wait_for_events(2, timeout=2.0), "Should have detected both files"
+            assert len(collector.batches) == 1
+            assert {(e.event_type, e.file_path.name) for e in collector.batches[0]} == {
+                (FileEventType.CREATED, "design1.md"),
+                (FileEventType.CREATED, "design2.md"),
+            }
+
+            # Files under one watch path are never reported deleted by another's scan
+            assert not collector.wait_for_event(timeout=0.2)
+
+        finally:
+            watcher.stop_watching()
+
+
 def test_polling_file_watcher_error_handling():
     """Test error handling in PollingFileWatcher."""
     watcher = PollingFileWatcher()
@@ -319,16 +813,95 @@ def test_polling_file_watcher_error_handling():
             assert "not a directory" in str(e)
 
 
+def test_inotify_file_watcher_detects_changes():
+    """Test that the inotify watcher reports changes without waiting for a timer."""
+    if not INOTIFY_AVAILABLE:
+        return  # inotify_simple not installed
+
+    with tempfile.TemporaryDirectory(dir=TEST_TEMP_ROOT) as temp_dir:
+        temp_path = Path(temp_dir)
+        # Poll interval far beyond the wait below: only inotify can trigger a scan
+        watcher = InotifyFileWatcher(poll_interval=60.0)
+        collector = EventCollector()
+        watcher.add_event_handler(collector.handle_event)
+
+        try:
+            watcher.start_watching(str(temp_path))
+
+            (temp_path / "design.md").write_text("# Design\n")
+            assert collector.wait_until(
+                lambda events: any(e.file_path.name == "design.md" for e in events), timeout=2.0
+            ), "Should have detected file creation"
+
+            # Directories created after start_watching are watched too
+            subdir_path = temp_path / "docs"
+            subdir_path.mkdir()
+            (subdir_path / "nested.md").write_text("# Nested\n")
+            assert collector.wait_until(
+                lambda events: any(e.file_path.name == "nested.md" for e in events), timeout=2.0
+            ), "Should have detected file creation in a new subdirectory"
+
+            (temp_path / "design.md").unlink()
+            assert collector.wait_until(
+                lambda events: any(e.event_type == FileEventType.DELETED for e in events), timeout=2.0
+            ), "Should have detected file deletion"
+
+        finally:
+            stop_started = time.monotonic()
+            watcher.stop_watching()
+            # Stopping wakes the blocked watch thread instead of waiting out a timeout
+            assert time.monotonic() - stop_started < 1.0
+
+        assert not watcher.is_watching()
+
+
+def test_inotify_file_watcher_rescans_changed_root_only():
+    """Test that an inotify event rescans only the watch path it occurred under."""
+    if not INOTIFY_AVAILABLE:
+        return  # inotify_simple not installed
+
+    with tempfile.TemporaryDirectory(dir=TEST_TEMP_ROOT) as temp_dir:
+        temp_path = Path(temp_dir)
+        first_path = temp_path / "first"
+        second_path = temp_path / "second"
+        (second_path / "docs").mkdir(parents=True)
+        first_path.mkdir()
+
+        watcher = InotifyFileWatcher(poll_interval=60.0)
+        collector = EventCollector()
+        watcher.add_event_handler(collector.handle_event)
+
+        try:
+            watcher.start_watching(str(first_path))
+            watcher.start_watching(str(second_path))
+
+            scanned_roots = []
+            original_collect = watcher._collect_changes
+
+            def recording_collect(directory: Path):
+                scanned_roots.append(directory)
+                return original_collect(directory)
+
+            watcher._collect_changes = recording_collect
+
+            (second_path / "docs" / "nested.md").write_text("# Nested\n")
+            assert collector.wait_for_event(timeout=2.0), "Should have detected file creation"
+            assert set(scanned_roots) == {second_path.resolve()}
+
+        finally:
+            watcher.stop_watching()
+
+
 def test_workspace_file_watcher_initialization():
     """Test WorkspaceFileWatcher initialization."""
-    # Test with polling watcher (always available)
+    # Test with the non-watchdog backend (always available)
     watcher = WorkspaceFileWatcher(use_watchdog=False)
-    assert watcher.watcher_type == "polling"
+    assert watcher.watcher_type == FALLBACK_WATCHER_TYPE
     assert not watcher.watcher.is_watching()
     assert len(watcher.get_watched_projects()) == 0
 
     info = watcher.get_watcher_info()
-    assert info['watcher_type'] == "polling"
+    assert info['watcher_type'] == FALLBACK_WATCHER_TYPE
     assert info['is_watching'] is False
     assert info['num_change_handlers'] == 0
 
@@ -349,18 +922,19 @@ def test_workspace_file_watcher_change_handlers():
 
 def test_workspace_file_watcher_project_watching():
     """Test project watching functionality."""
-    with tempfile.TemporaryDirectory() as temp_dir:
+    for use_watchdog in WATCHER_BACKENDS:
+        _check_workspace_file_watcher_project_watching(use_watchdog)
+
+
+def _check_workspace_file_watcher_project_watching(use_watchdog: bool) -> None:
+    with tempfile.TemporaryDirectory(dir=TEST_TEMP_ROOT) as temp_dir:
         temp_path = Path(temp_dir)
         project_path = temp_path / "test_project"
         project_path.mkdir()
 
-        watcher = WorkspaceFileWatcher(use_watchdog=False)
+        watcher = create_workspace_watcher(use_watchdog)
         collector = EventCollector()
 
-        # Cast to PollingFileWatcher to adjust poll interval
-        if hasattr(watcher.watcher, 'poll_interval'):
-            watcher.watcher.poll_interval = 0.1
-
         watcher.add_change_handler(collector.handle_change)
 
         try:
@@ -369,10 +943,6 @@ def test_workspace_file_watcher_project_watching():
             assert len(watcher.get_watched_projects()) == 1
             assert project_path in watcher.get_watched_projects()
 
-            # Wait for initial scan
-            time.sleep(0.2)
-            collector.clear_events()
-
             # Create a markdown file in the project
             md_file = project_path / "software-design.md"
             md_file.write_text("# Software Design\n\nDesign content here.")
@@ -393,7 +963,12 @@ def test_workspace_file_watcher_project_watching():
 
 def test_workspace_file_watcher_multiple_projects():
     """Test watching multiple projects simultaneously."""
-    with tempfile.TemporaryDirectory() as temp_dir:
+    for use_watchdog in WATCHER_BACKENDS:
+        _check_workspace_file_watcher_multiple_projects(use_watchdog)
+
+
+def _check_workspace_file_watcher_multiple_projects(use_watchdog: bool) -> None:
+    with tempfile.TemporaryDirectory(dir=TEST_TEMP_ROOT) as temp_dir:
         temp_path = Path(temp_dir)
 
         # Create multiple project directories
@@ -402,13 +977,9 @@ def test_workspace_file_watcher_multiple_projects():
         project1_path.mkdir()
         project2_path.mkdir()
 
-        watcher = WorkspaceFileWatcher(use_watchdog=False)
+        watcher = create_workspace_watcher(use_watchdog)
         collector = EventCollector()
 
-        # Cast to PollingFileWatcher to adjust poll interval
-        if hasattr(watcher.watcher, 'poll_interval'):
-            watcher.watcher.poll_interval = 0.1
-
         watcher.add_change_handler(collector.handle_change)
 
         try:
@@ -418,16 +989,16 @@ def test_workspace_file_watcher_multiple_projects():
 
             assert len(watcher.get_watched_projects()) == 2
 
-            # Wait for initial scan
-            time.sleep(0.2)
-            collector.clear_events()
-
             # Create files in different projects
             (project1_path / "design1.md").write_text("# Design 1")
             (project2_path / "design2.md").write_text("# Design 2")
 
-            # Wait for events
-            time.sleep(1.0)
+            # Wait for both creations; watchdog also reports a MODIFIED per write
+            def both_created(events):
+                created = {e.file_path.name for e in events if e.event_type == FileEventType.CREATED}
+                return {"design1.md", "design2.md"} <= created
+
+            assert collector.wait_until(both_created, timeout=2.0), "Should have detected both files"
 
             # Should detect files from both projects
             creation_events = [e for e in collector.events if e.event_type == FileEventType.CREATED]
@@ -443,7 +1014,7 @@ def test_workspace_file_watcher_multiple_projects():
 
 def test_workspace_file_watcher_unwatch_project():
     """Test unwatching individual projects."""
-    with tempfile.TemporaryDirectory() as temp_dir:
+    with tempfile.TemporaryDirectory(dir=TEST_TEMP_ROOT) as temp_dir:
         temp_path = Path(temp_dir)
         project_path = temp_path / "test_project"
         project_path.mkdir()
@@ -474,7 +1045,12 @@ def test_workspace_file_watcher_error_handling():
 
 def test_workspace_file_watcher_subdirectories():
     """Test that subdirectories are watched recursively."""
-    with tempfile.TemporaryDirectory() as temp_dir:
+    for use_watchdog in WATCHER_BACKENDS:
+        _check_workspace_file_watcher_subdirectories(use_watchdog)
+
+
+def _check_workspace_file_watcher_subdirectories(use_watchdog: bool) -> None:
+    with tempfile.TemporaryDirectory(dir=TEST_TEMP_ROOT) as temp_dir:
         temp_path = Path(temp_dir)
         project_path = temp_path / "test_project"
         subdir_path = project_path / "docs"
@@ -482,23 +1058,15 @@ def test_workspace_file_watcher_subdirectories():
         project_path.mkdir()
         subdir_path.mkdir()
 
-        watcher = WorkspaceFileWatcher(use_watchdog=False)
+        watcher = create_workspace_watcher(use_watchdog)
         collector = EventCollector()
 
-        # Cast to PollingFileWatcher to adjust poll interval
-        if hasattr(watcher.watcher, 'poll_interval'):
-            watcher.watcher.poll_interval = 0.1
-
         watcher.add_change_handler(collector.handle_change)
 
         try:
             # Start watching project
             watcher.watch_project(str(project_path))
 
-            # Wait for initial scan
-            time.sleep(0.2)
-            collector.clear_events()
-
             # Create file in subdirectory
             subfile = subdir_path / "documentation.md"
             subfile.write_text("# Documentation\n")
@@ -520,27 +1088,28 @@ def test_convenience_function():
     """Test convenience function for creating file watcher."""
     watcher = create_file_watcher(use_watchdog=False)
     assert isinstance(watcher, WorkspaceFileWatcher)
-    assert watcher.watcher_type == "polling"
+    assert watcher.watcher_type == FALLBACK_WATCHER_TYPE
 
     info = watcher.get_watcher_info()
     assert 'watcher_type' in info
     assert 'watchdog_available' in info
+    assert 'inotify_available' in info
 
 
 def test_event_handler_exception_handling():
     """Test that exceptions in event handlers don't crash the watcher."""
-    with tempfile.TemporaryDirectory() as temp_dir:
+    with tempfile.TemporaryDirectory(dir=TEST_TEMP_ROOT) as temp_dir:
         temp_path = Path(temp_dir)
 
         def failing_handler(event: FileSystemEvent) -> None:
             raise Exception("Handler error")
 
-        def working_handler(event: FileSystemEvent) -> None:
-            working_handler.called = True
+        working_handler_called = Event()
 
-        working_handler.called = False
+        def working_handler(event: FileSystemEvent) -> None:
+            working_handler_called.set()
 
-        watcher = PollingFileWatcher(poll_interval=0.1)
+        watcher = PollingFileWatcher(poll_interval=0.05)
         watcher.add_event_handler(failing_handler)
         watcher.add_event_handler(working_handler)
 
@@ -548,18 +1117,12 @@ def test_event_handler_exception_handling():
             # Start watching
             watcher.start_watching(str(temp_path))
 
-            # Wait for initial scan
-            time.sleep(0.2)
-
             # Create a file
             test_file = temp_path / "test.md"
             test_file.write_text("# Test")
 
-            # Wait for events
-            time.sleep(0.5)
-
             # Working handler should still be called despite failing handler
-            assert working_handler.called
+            assert working_handler_called.wait(timeout=2.0)
 
         finally:
             watcher.stop_watching()
@@ -575,6 +1138,12 @@ if __name__ == "__main__":
     test_file_system_event_move()
     print("✓ FileSystemEvent move operations")
 
+    test_file_system_event_msgpack_roundtrip()
+    print("✓ FileSystemEvent msgpack roundtrip")
+
+    test_markdown_suffix_detection()
+    print("✓ Markdown suffix detection")
+
     test_polling_file_watcher_initialization()
     print("✓ PollingFileWatcher initialization")
 
@@ -584,6 +1153,30 @@ if __name__ == "__main__":
     test_file_checksum_calculation()
     print("✓ File checksum calculation")
 
+    test_unchanged_file_reuses_checksum()
+    print("✓ Unchanged files skip re-hashing")
+
+    test_stat_fast_path_checks_inode_and_content()
+    print("✓ Stat fast path checks inode and content")
+
+    test_recent_file_is_rehashed_despite_unchanged_stat()
+    print("✓ Recently written file is re-hashed despite unchanged stat")
+
+    test_saved_state_skips_rehash_on_restart()
+    print("✓ Saved state skips re-hashing on restart")
+
+    test_scan_events_share_timestamp()
+    print("✓ Scan events share one timestamp")
+
+    test_unreadable_directory_is_skipped()
+    print("✓ Unreadable directories are skipped")
+
+    test_unchanged_directories_are_not_relisted()
+    print("✓ Unchanged directories are not re-listed")
+
+    test_parallel_file_states_match_serial()
+    print("✓ Parallel file state calculation")
+
     test_polling_file_watcher_file_creation()
     print("✓ File creation detection")
 
@@ -596,9 +1189,21 @@ if __name__ == "__main__":
     test_polling_file_watcher_non_markdown_files()
     print("✓ Non-markdown file filtering")
 
+    test_polling_file_watcher_batch_handlers()
+    print("✓ PollingFileWatcher batch event delivery")
+
+    test_polling_file_watcher_batch_spans_watch_paths()
+    print("✓ PollingFileWatcher batches span watch paths")
+
     test_polling_file_watcher_error_handling()
     print("✓ PollingFileWatcher error handling")
 
+    test_inotify_file_watcher_detects_changes()
+    print("✓ InotifyFileWatcher change detection")
+
+    test_inotify_file_watcher_rescans_changed_root_only()
+    print("✓ InotifyFileWatcher rescans only the changed root")
+
     test_workspace_file_watcher_initialization()
     print("✓ WorkspaceFileWatcher initialization")
 
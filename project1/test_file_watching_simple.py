@@ -8,7 +8,7 @@ import tempfile
 from pathlib import Path
 from file_watching import (
     FileSystemEvent, FileEventType, PollingFileWatcher, WorkspaceFileWatcher,
-    FileWatcherError, create_file_watcher
+    FileWatcherError, create_file_watcher, INOTIFY_AVAILABLE
 )
 
 
@@ -71,11 +71,12 @@ def test_basic_functionality():
 
     # Test WorkspaceFileWatcher initialization
     workspace_watcher = WorkspaceFileWatcher(use_watchdog=False)
-    assert workspace_watcher.watcher_type == "polling"
+    expected_type = "inotify" if INOTIFY_AVAILABLE else "polling"
+    assert workspace_watcher.watcher_type == expected_type
     assert len(workspace_watcher.get_watched_projects()) == 0
 
     info = workspace_watcher.get_watcher_info()
-    assert info['watcher_type'] == "polling"
+    assert info['watcher_type'] == expected_type
     assert info['is_watching'] is False
 
     print("✓ WorkspaceFileWatcher initialization")
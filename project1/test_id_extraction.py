@@ -4,7 +4,10 @@ Tests for ID extraction from markdown headings.
 This validates T:0004 acceptance criteria.
 """
 
+import os
 import tempfile
+import time
+from dataclasses import FrozenInstanceError
 from pathlib import Path
 from id_extraction import (
     MarkdownHeadingParser, IDValidator, ExtractedID, IDPrefix,
@@ -296,6 +299,55 @@ Component in file.
         Path(temp_file).unlink()
 
 
+def test_file_extraction_cache():
+    """Test that unchanged files are served from the cache and edits are re-parsed."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_file = Path(temp_dir) / "design.md"
+        temp_file.write_text("# R:Cached - Cached\n\n## C:Component - Component\n")
+
+        # A file written within the settle window is re-parsed on every call
+        fresh = extract_ids_from_file(str(temp_file))
+        assert extract_ids_from_file(str(temp_file))[0] is not fresh[0]
+
+        # Same-size edit stamped with the same mtime, as a coarse clock would
+        stat = temp_file.stat()
+        temp_file.write_text("# R:Cachet - Cached\n\n## C:Component - Component\n")
+        os.utime(temp_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert [e.full_id for e in extract_ids_from_file(str(temp_file))] == ["R:Cachet", "C:Component"]
+
+        temp_file.write_text("# R:Cached - Cached\n\n## C:Component - Component\n")
+        settled_ns = time.time_ns() - 10 * 1_000_000_000
+        os.utime(temp_file, ns=(settled_ns, settled_ns))
+
+        first = extract_ids_from_file(str(temp_file))
+        second = extract_ids_from_file(str(temp_file))
+        assert [e.full_id for e in second] == ["R:Cached", "C:Component"]
+        assert second[0] is first[0]  # Served from the cache
+        assert second is not first    # Callers get their own list
+
+        # Shared cached IDs cannot be modified by one caller
+        try:
+            second[0].full_id = "R:Changed"
+            assert False, "Should have raised FrozenInstanceError"
+        except FrozenInstanceError:
+            pass
+
+        # Uniqueness is still enforced against the parser's state on cache hits
+        parser = MarkdownHeadingParser(validate_uniqueness=True)
+        parser.extract_ids_from_file(str(temp_file))
+        try:
+            parser.extract_ids_from_file(str(temp_file))
+            assert False, "Should have raised ValueError"
+        except ValueError as e:
+            assert "Duplicate ID found: R:Cached at line 1" in str(e)
+
+        # An edit changes the stat, so the file is parsed again
+        stat = temp_file.stat()
+        temp_file.write_text("# R:Edited - Edited\n")
+        os.utime(temp_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert [e.full_id for e in extract_ids_from_file(str(temp_file))] == ["R:Edited"]
+
+
 def test_file_not_found():
     """Test proper error handling for missing files."""
     try:
@@ -423,6 +475,22 @@ More content.
     assert extracted_ids[1].full_id == "C:Component"
 
 
+def test_line_numbers_and_raw_lines():
+    """Test that line numbers and raw lines match the source text."""
+    markdown_text = "# R:First\n\ntext\n#\n## C:Second - Windows line\r\n\n\n### D:Third"
+
+    extracted_ids = extract_ids_from_markdown(markdown_text)
+
+    assert [(e.full_id, e.line_number) for e in extracted_ids] == [
+        ("R:First", 0), ("C:Second", 4), ("D:Third", 7)
+    ]
+    lines = markdown_text.split('\n')
+    assert all(e.raw_line == lines[e.line_number] for e in extracted_ids)
+
+    # Heading markers never pair with text on the following line
+    assert extract_ids_from_markdown("#\nR:Purpose\n") == []
+
+
 def test_real_project_file():
     """Test extraction from actual project files."""
     # Test with the actual software-design.md if it exists
@@ -477,6 +545,9 @@ if __name__ == "__main__":
     test_file_extraction()
     print("✓ File extraction")
 
+    test_file_extraction_cache()
+    print("✓ File extraction cache")
+
     test_file_not_found()
     print("✓ File not found error handling")
 
@@ -492,6 +563,9 @@ if __name__ == "__main__":
     test_whitespace_handling()
     print("✓ Whitespace handling")
 
+    test_line_numbers_and_raw_lines()
+    print("✓ Line numbers and raw lines")
+
     test_real_project_file()
     print("✓ Real project file parsing")
 
@@ -51,6 +51,7 @@ def test_add_remove_elements():
     index.add_element(element)
     assert index.get_element_count() == 1
     assert index.has_element("R:Purpose")
+    assert "R:Purpose" in index
 
     # Retrieve element
     retrieved = index.get_element("R:Purpose")
@@ -63,6 +64,7 @@ def test_add_remove_elements():
     assert removed is True
     assert index.get_element_count() == 0
     assert not index.has_element("R:Purpose")
+    assert "R:Purpose" not in index
 
     # Try to remove non-existent element
     removed = index.remove_element("NonExistent")
@@ -79,26 +81,43 @@ def test_o1_id_lookup():
         for i in range(1000)
     ]
 
-    for element in elements:
-        index.add_element(element)
+    # Track what the index itself allocates, including its search indices
+    import tracemalloc
+    tracemalloc.start()
+    try:
+        baseline_bytes = tracemalloc.get_traced_memory()[0]
+        for element in elements:
+            index.add_element(element)
+        index.search("Requirement")
+        index_bytes = tracemalloc.get_traced_memory()[0] - baseline_bytes
+    finally:
+        tracemalloc.stop()
 
     assert index.get_element_count() == 1000
+    assert index_bytes < 2_000_000, f"Index used {index_bytes} bytes for 1000 elements"
 
-    # Test lookups (should be O(1))
-    import time
-    start_time = time.time()
-
-    # Perform many lookups
+    # Lookups are spot-checked for correctness first
     for i in range(0, 1000, 100):
         element_id = f"R:{i:04d}"
         retrieved = index.get_element(element_id)
         assert retrieved is not None
         assert retrieved.id == element_id
 
-    lookup_time = time.time() - start_time
+    # Then timed over enough calls for a per-lookup figure to be meaningful.
+    # An O(N) lookup over 1000 elements costs tens of microseconds per call.
+    import time
+    get_element = index.get_element
+    element_ids = [element.id for element in elements]
+    rounds = 100
+
+    start_ns = time.perf_counter_ns()
+    for _ in range(rounds):
+        for element_id in element_ids:
+            get_element(element_id)
+    elapsed_ns = time.perf_counter_ns() - start_ns
 
-    # Lookups should be very fast (under 0.1 seconds for 10 lookups)
-    assert lookup_time < 0.1, f"Lookups took {lookup_time:.3f}s, may not be O(1)"
+    ns_per_lookup = elapsed_ns / (rounds * len(element_ids))
+    assert ns_per_lookup < 2000, f"Lookups took {ns_per_lookup:.0f}ns each, may not be O(1)"
 
 
 def test_file_based_lookup():
@@ -230,6 +249,26 @@ def test_search_partial_id_match():
             assert 0.0 < result.match_score < 1.0
 
 
+def test_search_partial_id_index_updates():
+    """Test partial ID search inside IDs and after elements are removed."""
+    index = DocumentIndex()
+
+    for i in range(200):
+        index.add_element(create_test_element(f"T:{i:04d}", f"Task {i}", Kind.TASK, File.DEVELOPMENT_PLAN))
+
+    # Substring in the middle of an ID
+    results = index.search("0150")
+    assert {r.element_id for r in results} == {"T:0150"}
+    assert all(r.match_type == "id_partial" for r in results)
+
+    # Removed elements are no longer found
+    index.remove_element("T:0150")
+    assert index.search("0150") == []
+
+    # Queries with no indexed trigrams find nothing
+    assert index.search("zzz") == []
+
+
 def test_search_title_match():
     """Test title search functionality."""
     index = DocumentIndex()
@@ -262,6 +301,20 @@ def test_search_title_match():
     assert "C:Component" in found_ids
 
 
+def test_search_title_match_once_per_element():
+    """Test elements matching several query words are reported once."""
+    index = DocumentIndex()
+
+    for i in range(50):
+        index.add_element(create_test_element(f"R:{i:04d}", f"Main System Requirement {i}",
+                                              Kind.REQUIREMENT, File.SOFTWARE_DESIGN))
+
+    results = index.search("main system requirement", limit=100)
+    assert len(results) == 50
+    assert len({r.element_id for r in results}) == 50
+    assert all(r.match_type == "title_partial" for r in results)
+
+
 def test_search_ranking():
     """Test search result ranking by relevance."""
     index = DocumentIndex()
@@ -396,6 +449,26 @@ def test_kind_based_lookup():
     assert tasks[0].id == "T:0001"
 
 
+def test_kind_lookup_tracks_updates():
+    """Test kind buckets follow element removal and kind changes."""
+    index = DocumentIndex()
+
+    index.add_element(create_test_element("X:Item", "Item", Kind.REQUIREMENT, File.SOFTWARE_DESIGN))
+    index.add_element(create_test_element("C:Component", "Component", Kind.COMPONENT, File.SOFTWARE_DESIGN))
+    assert [e.id for e in index.get_elements_by_kind(Kind.REQUIREMENT)] == ["X:Item"]
+
+    # Re-adding with a different kind moves the element between buckets
+    index.add_element(create_test_element("X:Item", "Item", Kind.DATA, File.SOFTWARE_DESIGN))
+    assert index.get_elements_by_kind(Kind.REQUIREMENT) == []
+    assert [e.id for e in index.get_elements_by_kind(Kind.DATA)] == ["X:Item"]
+
+    index.remove_element("C:Component")
+    assert index.get_elements_by_kind(Kind.COMPONENT) == []
+
+    index.clear()
+    assert index.get_elements_by_kind(Kind.DATA) == []
+
+
 def test_circular_reference_detection():
     """Test detection of circular references."""
     index = DocumentIndex()
@@ -424,6 +497,22 @@ def test_circular_reference_detection():
     assert cycle_elements == {"A:Element", "B:Element", "C:Element"}
 
 
+def test_circular_reference_edge_cases():
+    """Test self-references, missing targets and long acyclic chains."""
+    index = DocumentIndex()
+
+    index.add_element(create_test_element("S:Self", "Self", Kind.COMPONENT, File.SOFTWARE_DESIGN,
+                                          refs=["S:Self", "Missing:Element"]))
+    # A chain deeper than the default recursion limit, with no cycle
+    for i in range(2000):
+        refs = [f"L:{i + 1:04d}"] if i < 1999 else []
+        index.add_element(create_test_element(f"L:{i:04d}", f"Link {i}", Kind.DATA,
+                                              File.SOFTWARE_DESIGN, refs=refs))
+
+    cycles = index.find_circular_references()
+    assert cycles == [["S:Self", "S:Self"]]
+
+
 def test_index_updates():
     """Test updating existing elements in the index."""
     index = DocumentIndex()
@@ -457,6 +546,25 @@ def test_index_updates():
     assert results[0].element_id == "R:Purpose"
 
 
+def test_search_index_rebuilds_after_changes():
+    """Test the lazily built search index follows adds, removals and updates."""
+    index = DocumentIndex()
+
+    index.add_element(create_test_element("R:Purpose", "System Purpose", Kind.REQUIREMENT, File.SOFTWARE_DESIGN))
+    assert index.get_statistics().search_index_size == 2  # "system", "purpose"
+    assert [r.element_id for r in index.search("Purpose")] == ["R:Purpose"]
+
+    # Changes made between queries are all picked up by the next one
+    index.add_element(create_test_element("C:Component", "Main Component", Kind.COMPONENT, File.SOFTWARE_DESIGN))
+    index.add_element(create_test_element("R:Purpose", "Renamed Goal", Kind.REQUIREMENT, File.SOFTWARE_DESIGN))
+    index.remove_element("C:Component")
+
+    assert index.search("System") == []
+    assert index.search("Component") == []
+    assert [r.element_id for r in index.search("Renamed Goal")] == ["R:Purpose"]
+    assert index.get_statistics().search_index_size == 2  # "renamed", "goal"
+
+
 def test_clear_index():
     """Test clearing all index data."""
     index = DocumentIndex()
@@ -485,6 +593,33 @@ def test_clear_index():
     assert len(results) == 0
 
 
+def test_snapshot_is_independent():
+    """Test a snapshot can be mutated without affecting the original."""
+    index = DocumentIndex()
+    index.add_element(create_test_element("R:Purpose", "Purpose", Kind.REQUIREMENT, File.SOFTWARE_DESIGN))
+    index.add_element(create_test_element("C:Component", "Component", Kind.COMPONENT,
+                                          File.SOFTWARE_DESIGN, refs=["R:Purpose"]))
+
+    copy = index.snapshot()
+    assert copy.get_element_count() == 2
+    assert copy.get_backlinks("R:Purpose") == ["C:Component"]
+    assert [r.element_id for r in copy.search("Component")] == ["C:Component"]
+    assert copy.export_reference_graph() == index.export_reference_graph()
+
+    copy.remove_element("C:Component")
+    copy.add_element(create_test_element("T:0001", "Task", Kind.TASK, File.DEVELOPMENT_PLAN))
+    copy.clear()
+    assert copy.get_element_count() == 0
+
+    # The original is untouched
+    assert index.get_element_count() == 2
+    assert index.get_references("C:Component") == ["R:Purpose"]
+    assert index.get_backlinks("R:Purpose") == ["C:Component"]
+    assert [e.id for e in index.get_elements_by_kind(Kind.COMPONENT)] == ["C:Component"]
+    assert index.get_elements_by_file(File.DEVELOPMENT_PLAN) == []
+    assert [r.element_id for r in index.search("Component")] == ["C:Component"]
+
+
 def test_reference_graph_export():
     """Test exporting the complete reference graph."""
     index = DocumentIndex()
@@ -522,6 +657,29 @@ def test_reference_graph_export():
     assert backlinks_data["R:Purpose"] == ["C:Component"]
 
 
+def test_reference_graph_json_export():
+    """Test the cached JSON export matches the graph and follows changes."""
+    import json
+
+    index = DocumentIndex()
+    index.add_element(create_test_element("R:Purpose", "Purpose", Kind.REQUIREMENT, File.SOFTWARE_DESIGN))
+    index.add_element(create_test_element("C:Component", "Component", Kind.COMPONENT,
+                                          File.SOFTWARE_DESIGN, refs=["R:Purpose"]))
+
+    exported = index.export_reference_graph_json()
+    assert json.loads(exported) == index.export_reference_graph()
+    assert index.export_reference_graph_json() is exported  # Cached
+
+    # Any change invalidates the cached export
+    index.remove_element("C:Component")
+    data = json.loads(index.export_reference_graph_json())
+    assert set(data['elements']) == {"R:Purpose"}
+    assert data['references'] == {}
+
+    index.clear()
+    assert json.loads(index.export_reference_graph_json())['elements'] == {}
+
+
 def test_convenience_function():
     """Test convenience function for creating index."""
     index = create_index()
@@ -570,9 +728,15 @@ if __name__ == "__main__":
     test_search_partial_id_match()
     print("✓ Partial ID search")
 
+    test_search_partial_id_index_updates()
+    print("✓ Partial ID search index updates")
+
     test_search_title_match()
     print("✓ Title search")
 
+    test_search_title_match_once_per_element()
+    print("✓ Title search reports each element once")
+
     test_search_ranking()
     print("✓ Search result ranking")
 
@@ -585,18 +749,33 @@ if __name__ == "__main__":
     test_kind_based_lookup()
     print("✓ Kind-based lookup")
 
+    test_kind_lookup_tracks_updates()
+    print("✓ Kind lookup tracks updates")
+
     test_circular_reference_detection()
     print("✓ Circular reference detection")
 
+    test_circular_reference_edge_cases()
+    print("✓ Circular reference edge cases")
+
     test_index_updates()
     print("✓ Index updates")
 
+    test_search_index_rebuilds_after_changes()
+    print("✓ Search index rebuilds after changes")
+
     test_clear_index()
     print("✓ Clear index")
 
+    test_snapshot_is_independent()
+    print("✓ Snapshot independence")
+
     test_reference_graph_export()
     print("✓ Reference graph export")
 
+    test_reference_graph_json_export()
+    print("✓ Reference graph JSON export")
+
     test_convenience_function()
     print("✓ Convenience function")
 
@@ -232,6 +232,23 @@ Content.
     assert anchors["M:Method"] == "unicode-émojis-and-spëcial-chars"
 
 
+def test_anchor_separator_collapsing():
+    """Test anchors collapse mixed whitespace and hyphen runs and trim them at the ends."""
+    markdown_text = """# R:Edges - --Leading and trailing--
+
+## C:Mixed - Tabs\tand\u3000wide - - spaces
+
+### D:Symbols - (Only) -- [symbols] !
+"""
+
+    elements = parse_markdown_content(markdown_text)
+    anchors = {e.id: e.anchor for e in elements}
+
+    assert anchors["R:Edges"] == "leading-and-trailing"
+    assert anchors["C:Mixed"] == "tabs-and-wide-spaces"
+    assert anchors["D:Symbols"] == "only-symbols"
+
+
 def test_reference_integration():
     """Test integration with reference detection."""
     markdown_text = """# C:WorkspaceManager - Workspace Manager
@@ -430,6 +447,48 @@ Component content.
     assert all(e.file == File.SOFTWARE_DESIGN for e in elements)
 
 
+def test_repeated_parse_returns_independent_elements():
+    """Test re-parsing unchanged content gives equal but independent elements."""
+    markdown_text = """# T:0001 - Cached Task
+
+Uses R:Purpose.
+
+## C:Component - Component
+"""
+
+    first = parse_markdown_content(markdown_text, "development-plan.md")
+    first[0].add_reference("C:Extra")
+    first[0].add_backlink("C:Component")
+
+    second = parse_markdown_content(markdown_text, "development-plan.md")
+    assert [e.id for e in second] == ["T:0001", "C:Component"]
+    assert second[0].refs == ["R:Purpose"]
+    assert second[0].backlinks == []
+    assert second[0].file == File.DEVELOPMENT_PLAN
+    assert second[0] is not first[0]
+
+    # The same content under another file is parsed for that file
+    other = parse_markdown_content(markdown_text, "test-plan.md")
+    assert all(e.file == File.TEST_PLAN for e in other)
+
+
+def test_ids_are_interned():
+    """Test element IDs and references to them share one string object."""
+    markdown_text = """# R:Purpose - Purpose
+
+## C:First - First
+Uses R:Purpose.
+
+## C:Second - Second
+Also uses R:Purpose and C:First.
+"""
+
+    purpose, first, second = parse_markdown_content(markdown_text)
+    assert first.refs[0] is purpose.id
+    assert second.refs[0] is purpose.id
+    assert second.refs[1] is first.id
+
+
 def test_title_extraction():
     """Test clean title extraction from headings."""
     markdown_text = """# R:Purpose - System Purpose Title
@@ -547,6 +606,9 @@ if __name__ == "__main__":
     test_anchor_generation()
     print("✓ Anchor generation")
 
+    test_anchor_separator_collapsing()
+    print("✓ Anchor separator collapsing")
+
     test_reference_integration()
     print("✓ Reference integration")
 
@@ -565,6 +627,12 @@ if __name__ == "__main__":
     test_convenience_functions()
     print("✓ Convenience functions")
 
+    test_repeated_parse_returns_independent_elements()
+    print("✓ Repeated parse independence")
+
+    test_ids_are_interned()
+    print("✓ ID interning")
+
     test_title_extraction()
     print("✓ Title extraction")
 
@@ -398,6 +398,82 @@ def test_error_handling():
         pass  # Expected
 
 
+def test_validated_reference_construction():
+    """Test that Reference.validated rejects malformed reference data."""
+    ref = Reference.validated("C:Component", "inline", "uses C:Component", 0, 5)
+    assert ref.target_id == "C:Component"
+    assert ref.reference_type == "inline"
+
+    try:
+        Reference.validated("", "inline", "", 0, 0)
+        assert False, "Should raise ValueError for empty target_id"
+    except ValueError as e:
+        assert "cannot be empty" in str(e)
+
+    try:
+        Reference.validated("C:Component", "implicit", "", 0, 0)
+        assert False, "Should raise ValueError for unknown reference type"
+    except ValueError as e:
+        assert "Invalid reference type" in str(e)
+
+
+def test_batch_detection_matches_per_text_detection():
+    """Test that batch detection returns the same references as per-text calls."""
+    texts = [
+        "This implements C:WorkspaceManager and uses D:ProjectInfo.",
+        "No references here.",
+        "",
+        """Intro mentions M:loadProject.
+
+## References:
+
+- R:CoreRequirement - Main system requirement
+- UI:MainWindow - Primary interface""",
+        "Line 0 content.\nLine 1 has C:Component and C:Component again.",
+    ]
+
+    detector = ReferenceDetector()
+    batch_results = detector.detect_references_batch(texts)
+
+    assert len(batch_results) == len(texts)
+    for text, batch_refs in zip(texts, batch_results):
+        assert batch_refs == detector.detect_references_in_text(text)
+
+    # Line numbers are local to each text
+    component_ref = batch_results[4][0]
+    assert component_ref.target_id == "C:Component"
+    assert component_ref.line_number == 1
+
+
+def test_streaming_reference_detection():
+    """Test streaming detection over a line iterator."""
+    body_text = """This uses C:WorkspaceManager for loading.
+
+## References:
+
+- D:ProjectInfo - Project metadata
+
+## Notes
+
+Later mention of D:ProjectInfo and M:loadWorkspace."""
+
+    detector = ReferenceDetector()
+    streamed = list(detector.iter_references(body_text.splitlines(keepends=True)))
+
+    # Document order, no deduplication
+    assert [ref.target_id for ref in streamed] == [
+        "C:WorkspaceManager", "D:ProjectInfo", "D:ProjectInfo", "M:loadWorkspace"
+    ]
+    assert [ref.reference_type for ref in streamed] == [
+        "inline", "explicit", "inline", "inline"
+    ]
+    assert streamed[1].line_number == 4
+
+    # Same unique targets as whole-text detection
+    detected = detector.detect_references_in_text(body_text)
+    assert set(detector.extract_reference_ids(streamed)) == {ref.target_id for ref in detected}
+
+
 def test_references_with_special_characters():
     """Test references that include special markdown characters."""
     body_text = """This **implements** *C:WorkspaceManager* functionality.
@@ -480,6 +556,15 @@ if __name__ == "__main__":
     test_error_handling()
     print("✓ Error handling")
 
+    test_validated_reference_construction()
+    print("✓ Validated reference construction")
+
+    test_batch_detection_matches_per_text_detection()
+    print("✓ Batch detection")
+
+    test_streaming_reference_detection()
+    print("✓ Streaming detection")
+
     test_references_with_special_characters()
     print("✓ Special character handling")
 